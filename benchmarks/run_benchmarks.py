@@ -0,0 +1,165 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import pandas as pd
+
+from data_loading.loader_factory import get_loader
+from plots import plot_correlation_matrix, plot_data_uptime, plot_variable_boxplot, plot_variable_histogram, plot_variable_timeline
+from synthetic_data import generate_care_to_compare_files, generate_greenbyte_files
+from wind_farm_data import WindFarmDataset
+
+
+BASELINES_DIR = ROOT / "benchmarks" / "baselines"
+
+
+def measure(results: list, stage: str, func, *args, **kwargs):
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    result = func(*args, **kwargs)
+
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    results.append({"stage": stage, "seconds": round(seconds, 4), "peak_mb": round(peak / 2**20, 2)})
+    return result
+
+
+def read_files(dataset_type: str, files: list[Path]) -> list[pd.DataFrame]:
+    if dataset_type.startswith("caretocompare"):
+        return [pd.read_csv(file, sep=";", low_memory=False) for file in files]
+
+    return [pd.read_csv(file, skiprows=9, low_memory=False, index_col="# Date and time") for file in files]
+
+
+def run_scenario(dataset_type: str, folder: Path, files: list[Path]) -> list[dict]:
+    results = []
+    loader = get_loader(dataset_type, str(folder))
+
+    # parsing and standardization are measured separately, then the whole load_all for reference
+    frames = measure(results, "read_csv", read_files, dataset_type, files)
+    # timestamps parsed as in the loaders - standardization relies on a datetime index
+    if dataset_type.startswith("caretocompare"):
+        frames = [frame.set_index(pd.to_datetime(frame.pop("time_stamp"))) for frame in frames]
+    else:
+        frames = [frame.set_index(pd.to_datetime(frame.index, utc=True)) for frame in frames]
+    measure(results, "standarize_dataset", lambda: [loader.standarize_dataset(frame) for frame in frames])
+
+    data_frame = measure(results, "load_all", loader.load_all)
+    dataset = WindFarmDataset(data_frame, dataset_type=dataset_type)
+
+    measure(results, "analyze_availability", dataset.analyze_availability)
+    measure(results, "analyze_variable_ranges", dataset.analyze_variable_ranges, "all")
+    for normalization_type in ("z_score", "min_max", "robust"):
+        measure(results, f"normalize_data[{normalization_type}]", dataset.normalize_data, normalization_type)
+    measure(results, "set_correlation_matrix", dataset.set_correlation_matrix)
+    measure(results, "remove_correlated_signals", dataset.remove_correlated_signals, 0.95, True)
+
+    df = dataset.get_dataframe()
+    with warnings.catch_warnings():
+        # plt.show() warns on the non-interactive backend
+        warnings.simplefilter("ignore", UserWarning)
+        measure(results, "plot_data_uptime", plot_data_uptime, df, "all")
+        measure(results, "plot_variable_timeline", plot_variable_timeline, df, "power", "all")
+        measure(results, "plot_variable_boxplot", plot_variable_boxplot, df, "power", "all")
+        measure(results, "plot_variable_histogram", plot_variable_histogram, df, "power", "all")
+        measure(results, "plot_correlation_matrix", plot_correlation_matrix, dataset.get_correlation_matrix())
+    plt.close("all")
+
+    return results
+
+
+def compare_with_baseline(name: str, results: list[dict], tolerance: float) -> list[str]:
+    baseline_file = BASELINES_DIR / f"{name}.json"
+    baseline = {}
+
+    if baseline_file.exists():
+        with open(baseline_file, "r", encoding="utf-8") as file:
+            baseline = {row["stage"]: row for row in json.load(file)["results"]}
+    else:
+        print(f"No baseline for {name} ({baseline_file.name}), skipping comparison.")
+
+    regressions = []
+    print(f"{'stage':<32}{'seconds':>10}{'baseline':>10}{'ratio':>8}{'peak_mb':>10}{'baseline':>10}")
+    for row in results:
+        base = baseline.get(row["stage"])
+        if base is None:
+            print(f"{row['stage']:<32}{row['seconds']:>10}{'-':>10}{'-':>8}{row['peak_mb']:>10}{'-':>10}")
+            continue
+
+        ratio = row["seconds"] / base["seconds"] if base["seconds"] else float("inf")
+        print(f"{row['stage']:<32}{row['seconds']:>10}{base['seconds']:>10}{ratio:>8.2f}{row['peak_mb']:>10}{base['peak_mb']:>10}")
+
+        if ratio > tolerance or row["peak_mb"] > base["peak_mb"] * tolerance:
+            regressions.append(row["stage"])
+
+    return regressions
+
+
+def main():
+    # as in AppState.load_dataset - normalized frames share unchanged columns with the preprocessed one
+    if int(pd.__version__.split(".")[0]) < 3:
+        pd.set_option("mode.copy_on_write", True)
+
+    parser = argparse.ArgumentParser(description="Benchmark loading and analysis on synthetic wind farm data.")
+    parser.add_argument("--dataset", choices=["kelmarsh", "caretocompare", "all"], default="all")
+    parser.add_argument("--turbines", type=int, default=6)
+    parser.add_argument("--signals", type=int, default=20)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--nan-fraction", type=float, default=0.01)
+    parser.add_argument("--nan-run-length", type=int, default=2)
+    parser.add_argument("--gap-fraction", type=float, default=0.01)
+    parser.add_argument("--gap-length", type=int, default=12)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save-baseline", action="store_true", help="store results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=1.25, help="allowed slowdown/memory ratio vs baseline")
+    args = parser.parse_args()
+
+    # config/*.json are resolved relative to the repository root
+    os.chdir(ROOT)
+
+    pattern = dict(n_turbines=args.turbines, n_signals=args.signals, days=args.days, nan_fraction=args.nan_fraction,
+                   nan_run_length=args.nan_run_length, gap_fraction=args.gap_fraction, gap_length=args.gap_length,
+                   seed=args.seed)
+    generators = {"kelmarsh": generate_greenbyte_files, "caretocompare": generate_care_to_compare_files}
+    dataset_types = list(generators) if args.dataset == "all" else [args.dataset]
+
+    all_regressions = []
+    for dataset_type in dataset_types:
+        name = f"{dataset_type}_t{args.turbines}_s{args.signals}_d{args.days}"
+
+        with tempfile.TemporaryDirectory() as folder:
+            files = generators[dataset_type](folder, **pattern)
+            print(f"\n== {name}: {len(files)} files ==")
+            results = run_scenario(dataset_type, Path(folder), files)
+
+        regressions = compare_with_baseline(name, results, args.tolerance)
+        all_regressions.extend(f"{name}:{stage}" for stage in regressions)
+
+        if args.save_baseline:
+            BASELINES_DIR.mkdir(parents=True, exist_ok=True)
+            with open(BASELINES_DIR / f"{name}.json", "w", encoding="utf-8") as file:
+                json.dump({"scenario": pattern | {"dataset": dataset_type}, "results": results}, file, indent=2)
+            print(f"Saved baseline {name}.json")
+
+    if all_regressions:
+        print("\nRegressions over tolerance: " + ", ".join(all_regressions))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
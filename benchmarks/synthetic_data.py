@@ -0,0 +1,183 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+GREENBYTE_SIGNALS = ["Power (kW)", "Wind speed (m/s)", "Wind direction (°)"]
+
+
+def make_signal_block(rng: np.random.Generator, n_rows: int, n_signals: int) -> dict[str, np.ndarray]:
+    wind_speed = np.clip(8 + np.cumsum(rng.normal(0, 0.2, n_rows)) % 12 + rng.normal(0, 0.5, n_rows), 0, 30)
+    power = np.clip(2050 / (1 + np.exp(-(wind_speed - 9))) + rng.normal(0, 40, n_rows), -10, 2500)
+    wind_direction = (180 + np.cumsum(rng.normal(0, 2, n_rows))) % 360
+
+    signals = {"power": power, "wind_speed": wind_speed, "wind_direction": wind_direction}
+    for i in range(max(0, n_signals - len(signals))):
+        signals[f"signal_{i}"] = rng.normal(50 + i, 5, n_rows)
+
+    return signals
+
+
+def apply_missing_patterns(rng: np.random.Generator, values: np.ndarray, nan_fraction: float, nan_run_length: int):
+    if nan_fraction <= 0:
+        return values
+
+    n_rows = len(values)
+    n_runs = int(n_rows * nan_fraction / max(nan_run_length, 1))
+    starts = rng.integers(0, n_rows, n_runs)
+
+    for start in starts:
+        values[start:start + nan_run_length] = np.nan
+
+    return values
+
+
+def drop_gaps(rng: np.random.Generator, timestamps: pd.DatetimeIndex, gap_fraction: float, gap_length: int) -> np.ndarray:
+    keep = np.ones(len(timestamps), dtype=bool)
+    if gap_fraction <= 0:
+        return keep
+
+    n_gaps = int(len(timestamps) * gap_fraction / max(gap_length, 1))
+    for start in rng.integers(0, len(timestamps), n_gaps):
+        keep[start:start + gap_length] = False
+
+    return keep
+
+
+def generate_greenbyte_files(folder: str | Path, farm: str = "Kelmarsh", n_turbines: int = 6, n_signals: int = 20,
+                             days: int = 30, nan_fraction: float = 0.01, nan_run_length: int = 2,
+                             gap_fraction: float = 0.01, gap_length: int = 12, unavailable_fraction: float = 0.005,
+                             seed: int = 0) -> list[Path]:
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(seed)
+
+    timestamps = pd.date_range("2020-01-01", periods=days * 144, freq="10min")
+    files = []
+
+    for turbine in range(1, n_turbines + 1):
+        signals = make_signal_block(rng, len(timestamps), n_signals)
+        columns = {}
+
+        # Greenbyte exports use unit-suffixed names, the first three are unified by signals_dict.json
+        for i, (name, values) in enumerate(signals.items()):
+            column_name = GREENBYTE_SIGNALS[i] if i < len(GREENBYTE_SIGNALS) else f"{name} (unit)"
+            columns[column_name] = apply_missing_patterns(rng, values, nan_fraction, nan_run_length)
+
+        data_frame = pd.DataFrame(columns, index=timestamps.strftime("%Y-%m-%d %H:%M:%S"))
+        data_frame.index.name = "# Date and time"
+        data_frame["Data Availability"] = (rng.random(len(timestamps)) >= unavailable_fraction).astype(int)
+        data_frame = data_frame[drop_gaps(rng, timestamps, gap_fraction, gap_length)]
+
+        file = folder / f"Turbine_Data_{farm}_{turbine}_{timestamps[0]:%Y-%m-%d}_-_{timestamps[-1]:%Y-%m-%d}_{1000 + turbine}.csv"
+        with open(file, "w", encoding="utf-8", newline="") as csv_file:
+            csv_file.write("# This file was exported by Greenbyte Platform (synthetic)\n")
+            csv_file.write(f"# Turbine: {farm} {turbine}\n")
+            for line in range(7):
+                csv_file.write(f"# Header line {line}\n")
+            data_frame.to_csv(csv_file)
+
+        files.append(file)
+
+    return files
+
+
+def generate_care_to_compare_files(folder: str | Path, n_turbines: int = 3, n_signals: int = 20, days: int = 30,
+                                   nan_fraction: float = 0.01, nan_run_length: int = 2, gap_fraction: float = 0.01,
+                                   gap_length: int = 12, seed: int = 0) -> list[Path]:
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(seed)
+
+    timestamps = pd.date_range("2020-01-01", periods=days * 144, freq="10min")
+    files = []
+
+    for asset_id in range(n_turbines):
+        signals = make_signal_block(rng, len(timestamps), n_signals)
+        columns = {
+            f"sensor_{i}_avg": apply_missing_patterns(rng, values, nan_fraction, nan_run_length)
+            for i, values in enumerate(signals.values())
+        }
+        # CareToCompare signal names are anonymized, so unified names are added as extra columns
+        columns["power"] = signals["power"]
+        columns["wind_speed"] = signals["wind_speed"]
+
+        data_frame = pd.DataFrame(columns)
+        data_frame.insert(0, "time_stamp", timestamps.strftime("%Y-%m-%d %H:%M:%S"))
+        data_frame.insert(1, "asset_id", asset_id)
+        data_frame.insert(2, "id", np.arange(len(timestamps)))
+        data_frame["status_type_id"] = rng.choice([0, 0, 0, 0, 2, 3, 4, 5], size=len(timestamps))
+        data_frame = data_frame[drop_gaps(rng, timestamps, gap_fraction, gap_length)]
+
+        file = folder / f"{asset_id}.csv"
+        data_frame.to_csv(file, sep=";", index=False)
+        files.append(file)
+
+    return files
+
+
+def generate_greenbyte_status_files(folder: str | Path, farm: str = "Kelmarsh", n_turbines: int = 6, days: int = 30,
+                                    events_per_day: float = 10, seed: int = 0) -> list[Path]:
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(seed)
+
+    begin = pd.Timestamp("2020-01-01")
+    files = []
+
+    for turbine in range(1, n_turbines + 1):
+        n_events = int(days * events_per_day)
+        starts = begin + pd.to_timedelta(np.sort(rng.uniform(0, days * 86400, n_events)), unit="s")
+        ends = starts + pd.to_timedelta(rng.exponential(3600, n_events), unit="s")
+        messages = rng.choice(["Manual stop", "Grid fault", "Pitch warning", "Yaw error", "Running"], n_events)
+        categories = np.where(np.isin(messages, ["Grid fault", "Yaw error"]), "Forced outage", "Full Performance")
+
+        status_df = pd.DataFrame({
+            "Timestamp start": starts.strftime("%Y-%m-%d %H:%M:%S"),
+            "Timestamp end": ends.strftime("%Y-%m-%d %H:%M:%S"),
+            "Duration": (ends - starts).astype(str),
+            "Status": "Stop",
+            "Code": rng.integers(1, 500, n_events),
+            "Message": messages,
+            "Comment": "",
+            "Service contract category": "",
+            "IEC category": categories,
+        })
+
+        file = folder / f"Status_{farm}_{turbine}_{begin:%Y-%m-%d}_-_{begin + pd.Timedelta(days=days):%Y-%m-%d}_{1000 + turbine}.csv"
+        with open(file, "w", encoding="utf-8", newline="") as csv_file:
+            for line in range(9):
+                csv_file.write(f"# Header line {line}\n")
+            status_df.to_csv(csv_file, index=False)
+
+        files.append(file)
+
+    return files
+
+
+def generate_care_to_compare_events(folder: str | Path, n_turbines: int = 3, days: int = 30, events_per_turbine: int = 4,
+                                    seed: int = 0) -> Path:
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(seed)
+
+    begin = pd.Timestamp("2020-01-01")
+    rows = []
+    for asset_id in range(n_turbines):
+        for _ in range(events_per_turbine):
+            start = begin + pd.Timedelta(minutes=10 * int(rng.integers(0, days * 144)))
+            end = start + pd.Timedelta(hours=int(rng.integers(6, 72)))
+            label = rng.choice(["anomaly", "normal"])
+            rows.append({
+                "event_id": len(rows),
+                "event_label": label,
+                "event_start": f"{start:%Y-%m-%d %H:%M:%S}",
+                "event_end": f"{end:%Y-%m-%d %H:%M:%S}",
+                "asset_id": asset_id,
+                "event_description": "Generator bearing failure" if label == "anomaly" else None,
+            })
+
+    file = folder / "event_info.csv"
+    pd.DataFrame(rows).to_csv(file, sep=";", index=False)
+    return file
@@ -0,0 +1,152 @@
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from utils.file_handler import ID_COLUMNS
+
+
+class RollingDetector(ABC):
+    # Rolling windows are time based ("6h"), so gaps in the 10-minute data shrink the window
+    # instead of stretching it. pandas updates rolling mean/std incrementally (add/remove one
+    # sample per step) and rolling median with a skiplist, so no window is recomputed from scratch.
+    def __init__(self, window: str = "6h", threshold: float = 5.0, min_periods: int = 12):
+        self.window = pd.Timedelta(window)
+        self.threshold = threshold
+        self.min_periods = min_periods
+
+
+    @abstractmethod
+    def score(self, df: pd.DataFrame) -> pd.DataFrame:
+        pass
+
+
+    def detect(self, df: pd.DataFrame) -> pd.DataFrame:
+        scores = self.score(df)
+        return scores.abs() > self.threshold
+
+
+    def rolling(self, df: pd.DataFrame):
+        # closed="left" - sample is compared against the window preceding it
+        return df.rolling(self.window, min_periods=self.min_periods, closed="left")
+
+
+class RollingZScoreDetector(RollingDetector):
+    def score(self, df: pd.DataFrame) -> pd.DataFrame:
+        rolling = self.rolling(df)
+        mean = rolling.mean()
+        std = rolling.std().replace(0, np.nan)
+
+        return (df - mean) / std
+
+
+class RollingRobustDetector(RollingDetector):
+    def score(self, df: pd.DataFrame) -> pd.DataFrame:
+        median = self.rolling(df).median()
+        deviation = (df - median).abs()
+
+        # MAD estimated from deviations to the rolling median, scaled to be comparable with std
+        mad = self.rolling(deviation).median().replace(0, np.nan)
+
+        return 0.6745 * (df - median) / mad
+
+
+class RateOfChangeDetector(RollingZScoreDetector):
+    def __init__(self, window: str = "6h", threshold: float = 6.0, min_periods: int = 12, max_step: str = "10min"):
+        super().__init__(window, threshold, min_periods)
+        self.max_step = pd.Timedelta(max_step)
+
+
+    def score(self, df: pd.DataFrame) -> pd.DataFrame:
+        steps = df.index.to_series().diff()
+        change = df.diff()
+
+        # change across a gap in the data is not a rate of change
+        change[(steps > self.max_step).to_numpy()] = np.nan
+
+        return super().score(change)
+
+
+class AnomalyEngine:
+    def __init__(self, detectors: list[RollingDetector] | None = None, signals: list[str] | None = None,
+                 min_signals: int = 1, max_workers: int | None = None, group_col: str = "turbine_id"):
+        if detectors is None:
+            detectors = [RollingZScoreDetector(), RollingRobustDetector(threshold=6.0), RateOfChangeDetector()]
+
+        self.detectors = detectors
+        self.signals = signals
+        self.min_signals = min_signals
+        self.max_workers = max_workers or os.cpu_count()
+        self.group_col = group_col
+
+        # last window of raw values per turbine, carried over between chunks
+        self.tails = {}
+        self.history = max(detector.window for detector in detectors)
+
+
+    def reset(self):
+        self.tails = {}
+
+
+    def select_signals(self, df: pd.DataFrame) -> list[str]:
+        if self.signals:
+            return [col for col in self.signals if col in df.columns]
+
+        num_cols = df.select_dtypes(include=[np.number]).columns
+        return [col for col in num_cols if col not in ID_COLUMNS]
+
+
+    def process_chunk(self, df: pd.DataFrame) -> pd.Series:
+        signals = self.select_signals(df)
+        anomaly = np.zeros(len(df), dtype=bool)
+
+        if not signals or df.empty:
+            return pd.Series(anomaly, index=df.index, name="anomaly")
+
+        if self.group_col in df.columns:
+            groups = df.groupby(self.group_col, sort=False).indices
+        else:
+            groups = {None: np.arange(len(df))}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                turbine_id: executor.submit(self.process_turbine, turbine_id, df.iloc[positions][signals])
+                for turbine_id, positions in groups.items()
+            }
+
+            for turbine_id, future in futures.items():
+                anomaly[groups[turbine_id]] = future.result()
+
+        return pd.Series(anomaly, index=df.index, name="anomaly")
+
+
+    def process_turbine(self, turbine_id, chunk: pd.DataFrame) -> np.ndarray:
+        result = np.zeros(len(chunk), dtype=bool)
+
+        valid_time = chunk.index.notna()
+        order = np.argsort(chunk.index[valid_time], kind="stable")
+        positions = np.flatnonzero(valid_time)[order]
+        chunk = chunk.iloc[positions].astype(float)
+
+        if chunk.empty:
+            return result
+
+        tail = self.tails.get(turbine_id)
+        if tail is not None:
+            # newer data replaces any overlapping part of the carried window
+            tail = tail[tail.index < chunk.index[0]].reindex(columns=chunk.columns)
+            combined = pd.concat([tail, chunk])
+        else:
+            combined = chunk
+
+        votes = np.zeros(combined.shape, dtype=bool)
+        for detector in self.detectors:
+            votes |= detector.detect(combined).to_numpy()
+
+        new_votes = votes[len(combined) - len(chunk):]
+        result[positions] = new_votes.sum(axis=1) >= self.min_signals
+
+        self.tails[turbine_id] = combined[combined.index > combined.index[-1] - self.history]
+        return result
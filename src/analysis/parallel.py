@@ -0,0 +1,163 @@
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+
+# arrays attached in each worker process, filled by attach_shared_arrays
+_shared_arrays = {}
+
+
+def attach_shared_arrays(specs: dict):
+    for key, (name, shape, dtype) in specs.items():
+        block = shared_memory.SharedMemory(name=name)
+        _shared_arrays[key] = (block, np.ndarray(shape, dtype=dtype, buffer=block.buf))
+
+
+def run_on_shared_segment(func, start: int, stop: int, args: tuple):
+    values = _shared_arrays["values"][1]
+    times = _shared_arrays["times"][1]
+
+    return func(values[start:stop], times[start:stop], *args)
+
+
+def release_shared_memory(blocks: list, pool):
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+    for block in blocks:
+        block.close()
+        block.unlink()
+
+
+class SharedTurbineExecutor:
+    # Runs a reduction per turbine. In-process, every turbine's rows are taken from data_frame one
+    # at a time, without a copy of the frame. With processes, the values are written once into
+    # shared memory (sorted by turbine) on the first map and kept, with the pool, until close - workers
+    # attach to the block at start-up and get per-turbine row slices, so only slice bounds and results
+    # are pickled.
+    def __init__(self, data_frame: pd.DataFrame, columns: list[str], group_col: str = "turbine_id",
+                 max_workers: int | None = None, min_parallel_rows: int = 500_000):
+        self.data_frame = data_frame
+        self.columns = list(columns)
+        self.max_workers = max_workers or os.cpu_count()
+        self.use_processes = self.max_workers > 1 and len(data_frame) >= min_parallel_rows
+
+        turbine_ids = data_frame[group_col].to_numpy()
+        order = np.argsort(turbine_ids, kind="stable")
+        sorted_ids = turbine_ids[order]
+
+        boundaries = np.flatnonzero(sorted_ids[1:] != sorted_ids[:-1]) + 1
+        starts = np.concatenate([[0], boundaries]) if len(sorted_ids) else np.array([], dtype=int)
+        stops = np.concatenate([boundaries, [len(sorted_ids)]]) if len(sorted_ids) else np.array([], dtype=int)
+        self.segments = [(sorted_ids[start], int(start), int(stop)) for start, stop in zip(starts, stops)]
+        # row positions in data_frame of the sorted rows, to scatter per-row results back
+        self.order = order
+        self.tz = getattr(data_frame.index, "tz", None)
+        self.time_unit = getattr(data_frame.index, "unit", "ns")
+
+        self.shared_blocks = []
+        self.pool = None
+        self.finalizer = None
+
+
+    def segment_rows(self, start: int, stop: int) -> slice | np.ndarray:
+        # a slice when the turbine's rows are contiguous in data_frame (frames loaded file by file)
+        rows = self.order[start:stop]
+        if len(rows) and rows[-1] - rows[0] == len(rows) - 1 and np.all(np.diff(rows) == 1):
+            return slice(int(rows[0]), int(rows[-1]) + 1)
+
+        return rows
+
+
+    def segment_arrays(self, start: int, stop: int) -> tuple[np.ndarray, np.ndarray]:
+        rows = self.segment_rows(start, stop)
+
+        # column by column - to_numpy over mixed dtypes goes through larger intermediate arrays
+        values = np.empty((stop - start, len(self.columns)))
+        for i, col in enumerate(self.columns):
+            values[:, i] = self.data_frame[col].to_numpy()[rows]
+
+        return values, self.data_frame.index[rows].as_unit("ns").asi8
+
+
+    def map(self, func, *args) -> list[tuple]:
+        if not self.use_processes:
+            return [
+                (turbine_id, func(*self.segment_arrays(start, stop), *args))
+                for turbine_id, start, stop in self.segments
+            ]
+
+        if self.pool is None:
+            self.start_processes()
+
+        futures = [
+            (turbine_id, self.pool.submit(run_on_shared_segment, func, start, stop, args))
+            for turbine_id, start, stop in self.segments
+        ]
+        return [(turbine_id, future.result()) for turbine_id, future in futures]
+
+
+    def start_processes(self):
+        blocks = []
+        try:
+            specs = {}
+            n_rows = len(self.data_frame)
+            for key, shape, dtype in (("values", (n_rows, len(self.columns)), np.float64), ("times", (n_rows,), np.int64)):
+                block = shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape)) * 8, 1))
+                blocks.append(block)
+                specs[key] = (block.name, shape, np.dtype(dtype).str)
+
+            # filled column by column, without an intermediate copy of the whole frame
+            values = np.ndarray(specs["values"][1], dtype=np.float64, buffer=blocks[0].buf)
+            for i, col in enumerate(self.columns):
+                values[:, i] = self.data_frame[col].to_numpy(dtype=np.float64)[self.order]
+            times = np.ndarray(specs["times"][1], dtype=np.int64, buffer=blocks[1].buf)
+            times[:] = self.data_frame.index.as_unit("ns").asi8[self.order]
+            del values, times
+
+            pool = ProcessPoolExecutor(max_workers=self.max_workers, initializer=attach_shared_arrays, initargs=(specs,))
+        except BaseException:
+            release_shared_memory(blocks, None)
+            raise
+
+        self.shared_blocks = blocks
+        self.pool = pool
+        # released on close, or when the executor is garbage collected / the interpreter exits
+        self.finalizer = weakref.finalize(self, release_shared_memory, blocks, pool)
+
+
+    def close(self):
+        if self.finalizer is not None:
+            self.finalizer()
+
+        self.shared_blocks = []
+        self.pool = None
+        self.finalizer = None
+
+
+    def shared_memory_bytes(self) -> int:
+        return sum(block.size for block in self.shared_blocks)
+
+
+    def to_timestamp(self, value: int) -> pd.Timestamp:
+        return pd.Timestamp(value, tz=self.tz).as_unit(self.time_unit)
+
+
+NAT_VALUE = np.iinfo(np.int64).min
+
+
+def availability_reduction(values: np.ndarray, times: np.ndarray, invalid_col: int) -> dict:
+    # rows with unparsable timestamps (NaT) are counted, but do not bound the time range
+    valid_times = times[times != NAT_VALUE]
+
+    return {
+        "datapoints": len(values),
+        "missing_values": int(np.isnan(values).sum()),
+        "invalid_datapoints": int(np.nansum(values[:, invalid_col])),
+        "first_timestamp": int(valid_times.min()) if len(valid_times) else NAT_VALUE,
+        "last_timestamp": int(valid_times.max()) if len(valid_times) else NAT_VALUE,
+    }
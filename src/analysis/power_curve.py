@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+
+
+def bin_power_curve(turbine_ids: np.ndarray, wind_speed: np.ndarray, power: np.ndarray,
+                    bin_width: float = 0.5, quantiles: tuple[float, ...] = (0.1, 0.5, 0.9),
+                    fit_mask: np.ndarray | None = None) -> tuple[pd.DataFrame, np.ndarray]:
+    turbine_codes, turbines = pd.factorize(turbine_ids, sort=True)
+    wind_speed = np.asarray(wind_speed, dtype=float)
+    power = np.asarray(power, dtype=float)
+
+    usable = (turbine_codes >= 0) & np.isfinite(wind_speed) & np.isfinite(power) & (wind_speed >= 0)
+    fit = usable if fit_mask is None else usable & fit_mask
+
+    # bins sized by the fitted rows only - a corrupt, excluded wind speed must not size the arrays;
+    # rows beyond the largest fitted bin have no curve to compare with and get a NaN residual
+    bin_positions = np.full(len(wind_speed), np.nan)
+    bin_positions[usable] = np.floor(wind_speed[usable] / bin_width)
+    n_bins = int(bin_positions[fit].max()) + 1 if fit.any() else 0
+    in_range = usable & (bin_positions < n_bins)
+
+    # one flat key per (turbine, wind speed bin) - all reductions are bincounts over it
+    keys = np.full(len(wind_speed), -1, dtype=np.int64)
+    keys[in_range] = turbine_codes[in_range] * n_bins + bin_positions[in_range].astype(np.int64)
+    n_keys = len(turbines) * n_bins
+
+    fit_keys = keys[fit]
+    fit_power = power[fit]
+
+    counts = np.bincount(fit_keys, minlength=n_keys)
+    sums = np.bincount(fit_keys, weights=fit_power, minlength=n_keys)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums / counts
+        squared_dev = np.bincount(fit_keys, weights=(fit_power - means[fit_keys]) ** 2, minlength=n_keys)
+        stds = np.sqrt(squared_dev / (counts - 1))
+        stds[stds == 0] = np.nan
+
+    # quantiles from sorted segments: rows sorted by key, then by power within each key
+    order = np.lexsort((fit_power, fit_keys))
+    sorted_power = fit_power[order]
+    starts = np.cumsum(counts) - counts
+    filled = counts > 0
+
+    curve = pd.DataFrame({
+        "turbine_id": np.repeat(turbines, n_bins),
+        "wind_speed_bin": np.tile((np.arange(n_bins) + 0.5) * bin_width, len(turbines)),
+        "count": counts,
+        "power_mean": means,
+        "power_std": stds,
+    })
+
+    for q in quantiles:
+        position = starts[filled] + q * (counts[filled] - 1)
+        lower = np.floor(position).astype(np.int64)
+        upper = np.ceil(position).astype(np.int64)
+        fraction = position - lower
+
+        values = np.full(n_keys, np.nan)
+        values[filled] = sorted_power[lower] + (sorted_power[upper] - sorted_power[lower]) * fraction
+        curve[f"power_q{round(q * 100)}"] = values
+
+    curve = curve[filled].reset_index(drop=True)
+
+    residuals = np.full(len(power), np.nan)
+    residuals_z = np.full(len(power), np.nan)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        residuals[in_range] = power[in_range] - means[keys[in_range]]
+        residuals_z[in_range] = residuals[in_range] / stds[keys[in_range]]
+
+    return curve, np.column_stack([residuals, residuals_z])
@@ -0,0 +1,148 @@
+import numpy as np
+import pandas as pd
+
+
+class KLLSketch:
+    # KLL quantile sketch: level h keeps items of weight 2**h, a full level is sorted and every
+    # other item (random offset) is promoted. Rank error is about 1.7 / k, independent of the
+    # number of values; sketches of separate chunks or turbines merge without losing the bound.
+    def __init__(self, k: int = 200, seed: int | None = None):
+        self.k = k
+        self.levels = [np.empty(0)]
+        self.rng = np.random.default_rng(seed)
+
+        # exact moments and extremes, merged with Chan's formula
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.nan
+        self.max = np.nan
+
+
+    @staticmethod
+    def k_for_error(epsilon: float) -> int:
+        return int(np.ceil(1.7 / epsilon))
+
+
+    def capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+
+    def update(self, values: np.ndarray):
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+
+        self.update_moments(len(values), values.mean(), ((values - values.mean()) ** 2).sum(), values.min(), values.max())
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self.compress()
+
+
+    def update_moments(self, count: int, mean: float, m2: float, min_val: float, max_val: float):
+        total = self.count + count
+        delta = mean - self.mean
+
+        self.m2 += m2 + delta ** 2 * self.count * count / total
+        self.mean += delta * count / total
+        self.count = total
+        self.min = np.fmin(self.min, min_val)
+        self.max = np.fmax(self.max, max_val)
+
+
+    def compress(self):
+        level = 0
+        while level < len(self.levels):
+            if len(self.levels[level]) > self.capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+
+                items = np.sort(self.levels[level])
+                # odd item stays on its level so the total weight is preserved
+                keep = items[-1:] if len(items) % 2 else items[:0]
+                paired = items[:len(items) - len(keep)]
+
+                promoted = paired[self.rng.integers(2)::2]
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+
+                # capacities depend on the number of levels, so check again from the bottom
+                level = 0
+                continue
+
+            level += 1
+
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        if other.count:
+            self.update_moments(other.count, other.mean, other.m2, other.min, other.max)
+
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+
+        self.compress()
+        return self
+
+
+    def quantile(self, quantiles) -> np.ndarray:
+        quantiles = np.atleast_1d(np.asarray(quantiles, dtype=float))
+        if self.count == 0:
+            return np.full(len(quantiles), np.nan)
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level_items), 2 ** level) for level, level_items in enumerate(self.levels)])
+
+        order = np.argsort(items, kind="stable")
+        items = items[order]
+        cumulative = np.cumsum(weights[order])
+
+        positions = np.searchsorted(cumulative, quantiles * cumulative[-1], side="left")
+        result = items[np.minimum(positions, len(items) - 1)]
+
+        result[quantiles <= 0] = self.min
+        result[quantiles >= 1] = self.max
+        return result
+
+
+    @property
+    def std(self) -> float:
+        return np.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else np.nan
+
+
+class SketchStore:
+    def __init__(self, k: int = 200, group_col: str = "turbine_id"):
+        self.k = k
+        self.group_col = group_col
+        self.sketches = {}
+
+
+    def update(self, df: pd.DataFrame, signals: list[str]):
+        for turbine_id, positions in df.groupby(self.group_col, sort=True).indices.items():
+            turbine_values = df[signals].iloc[positions]
+
+            for signal in signals:
+                sketch = self.sketches.setdefault((turbine_id, signal), KLLSketch(self.k, seed=len(self.sketches)))
+                sketch.update(turbine_values[signal].to_numpy(dtype=float))
+
+
+    def drop_turbines(self, turbine_ids: list):
+        self.sketches = {key: sketch for key, sketch in self.sketches.items() if key[0] not in turbine_ids}
+
+
+    def get(self, signal: str, turbine_id=None) -> KLLSketch:
+        if turbine_id is not None:
+            return self.sketches.get((turbine_id, signal), KLLSketch(self.k))
+
+        merged = KLLSketch(self.k, seed=0)
+        for (_, sketch_signal), sketch in self.sketches.items():
+            if sketch_signal == signal:
+                merged.merge(sketch)
+
+        return merged
+
+
+    def get_turbines(self, signal: str) -> list:
+        return sorted(turbine_id for turbine_id, sketch_signal in self.sketches if sketch_signal == signal)
@@ -0,0 +1,144 @@
+import numpy as np
+import pandas as pd
+
+from analysis.parallel import NAT_VALUE
+
+
+WINDOW_STATS = ("mean", "std", "min", "max", "slope")
+
+
+def window_periods(windows: list[str], period: str = "10min") -> list[int]:
+    step = pd.Timedelta(period)
+    periods = []
+
+    for window in windows:
+        length = pd.Timedelta(window) / step
+        if length < 1 or length != int(length):
+            raise ValueError(f"Window '{window}' is not a multiple of the sampling period {period}.")
+        periods.append(int(length))
+
+    return periods
+
+
+def trailing_sums(cumulative: np.ndarray, length: int) -> np.ndarray:
+    # cumulative has a leading column of zeros, the window ending at grid step i covers steps (i - length, i]
+    sums = np.empty((cumulative.shape[0], cumulative.shape[1] - 1), dtype=cumulative.dtype)
+    head = min(length, sums.shape[1])
+    sums[:, :head] = cumulative[:, 1:head + 1]
+    sums[:, head:] = cumulative[:, length + 1:] - cumulative[:, 1:-length]
+
+    return sums
+
+
+def cumulative_sum(values: np.ndarray) -> np.ndarray:
+    cumulative = np.zeros((values.shape[0], values.shape[1] + 1), dtype=values.dtype)
+    np.cumsum(values, axis=1, out=cumulative[:, 1:])
+    return cumulative
+
+
+def trailing_extreme(values: np.ndarray, length: int, reducer: np.ufunc, fill: float) -> np.ndarray:
+    # van Herk/Gil-Werman: the padded steps viewed as blocks of `length`, every window spans the end
+    # of one block and the start of the next - one prefix and one suffix scan, independent of the length
+    n_signals, n_steps = values.shape
+    n_blocks = -(-(n_steps + length - 1) // length)
+    padded = np.full((n_signals, n_blocks * length), fill)
+    padded[:, length - 1:length - 1 + n_steps] = np.where(np.isnan(values), fill, values)
+
+    blocks = padded.reshape(n_signals, n_blocks, length)
+    prefix = reducer.accumulate(blocks, axis=2).reshape(n_signals, -1)
+    suffix = reducer.accumulate(blocks[:, :, ::-1], axis=2)[:, :, ::-1].reshape(n_signals, -1)
+
+    extreme = reducer(suffix[:, :n_steps], prefix[:, length - 1:length - 1 + n_steps])
+    extreme[extreme == fill] = np.nan
+
+    return extreme
+
+
+def turbine_window_features(values: np.ndarray, times: np.ndarray, column_indices: list[int],
+                            lengths: list[int], stats: tuple[str, ...], period_ns: int, min_periods: int) -> np.ndarray:
+    n_rows = len(values)
+    n_signals = len(column_indices)
+
+    # rows without a timestamp (NaT) have no place on the grid, their features are NaN
+    dated = times != NAT_VALUE
+    if not dated.all():
+        result = np.full((len(lengths) * len(stats) * n_signals, n_rows), np.nan)
+        result[:, dated] = turbine_window_features(values[dated], times[dated], column_indices, lengths,
+                                                   stats, period_ns, min_periods)
+        return result
+
+    result = np.empty((len(lengths), len(stats), n_signals, n_rows))
+    if n_rows == 0:
+        return result.reshape(-1, n_rows)
+
+    # rows placed on the regular grid, gaps become NaN steps and are skipped by every statistic;
+    # gaps longer than the longest window are shortened to it - no window spans them either way,
+    # so a far-off (e.g. corrupt) timestamp does not stretch the grid.
+    # offsets from the first row as uint64, the span of int64 timestamps does not fit in int64
+    order = np.argsort(times, kind="stable")
+    offsets = (times[order] - times[order[0]]).astype(np.uint64)
+    steps = (offsets + np.uint64(period_ns // 2)) // np.uint64(period_ns)
+    positions = np.empty(n_rows, dtype=np.int64)
+    positions[order] = np.concatenate([[0], np.cumsum(np.minimum(np.diff(steps), max(lengths)).astype(np.int64))])
+
+    # signal-major layout, so every scan runs over contiguous memory
+    grid = np.full((n_signals, int(positions.max()) + 1), np.nan)
+    grid[:, positions] = values[:, column_indices].T
+    has_gaps = not np.array_equal(positions, np.arange(n_rows))
+
+    valid = ~np.isnan(grid)
+    # shifted by the signal mean, so the sums of squares do not lose precision
+    signal_counts = valid.sum(axis=1)
+    offset = np.where(signal_counts > 0, np.where(valid, grid, 0.0).sum(axis=1) / np.maximum(signal_counts, 1), 0.0)[:, None]
+    centered = np.where(valid, grid - offset, 0.0)
+
+    cum_count = cumulative_sum(valid.astype(np.int64))
+    cum_sum = cumulative_sum(centered)
+    if "std" in stats:
+        cum_sq = cumulative_sum(centered ** 2)
+
+    if "slope" in stats:
+        # grid steps as integers - their window sums are exact, only the sums with values are rounded
+        steps = np.arange(grid.shape[1], dtype=np.int64)
+        cum_t = cumulative_sum(np.where(valid, steps, 0))
+        cum_tt = cumulative_sum(np.where(valid, steps ** 2, 0))
+        cum_tx = cumulative_sum(steps * centered)
+        steps_per_hour = 3.6e12 / period_ns
+
+    for w, length in enumerate(lengths):
+        count = trailing_sums(cum_count, length)
+        total = trailing_sums(cum_sum, length)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            for s, stat in enumerate(stats):
+                if stat == "mean":
+                    feature = total / count + offset
+                elif stat == "std":
+                    squares = trailing_sums(cum_sq, length)
+                    feature = np.sqrt(np.maximum(squares - total ** 2 / count, 0) / (count - 1))
+                    feature[count < 2] = np.nan
+                elif stat == "min":
+                    feature = trailing_extreme(grid, length, np.minimum, np.inf)
+                elif stat == "max":
+                    feature = trailing_extreme(grid, length, np.maximum, -np.inf)
+                elif stat == "slope":
+                    sum_t = trailing_sums(cum_t, length)
+                    sum_tt = trailing_sums(cum_tt, length)
+                    sum_tx = trailing_sums(cum_tx, length)
+                    denominator = count * sum_tt - sum_t ** 2
+                    feature = (count * sum_tx - sum_t * total) / denominator * steps_per_hour
+                    feature[(count < 2) | (denominator <= 0)] = np.nan
+                else:
+                    raise ValueError(f"Unknown window statistic: {stat}")
+
+                if min_periods > 1:
+                    feature[count < min_periods] = np.nan
+                # grid steps back to rows, without a gather when there are no gaps
+                result[w, s] = feature[:, positions] if has_gaps else feature
+
+    # features x rows, features ordered by window, statistic and signal
+    return result.reshape(-1, n_rows)
+
+
+def feature_names(signals: list[str], windows: list[str], stats: tuple[str, ...]) -> list[str]:
+    return [f"{signal}_{stat}_{window}" for window in windows for stat in stats for signal in signals]
@@ -1,16 +1,86 @@
 class AppState:
     def __init__(self):
         self.dataset = None
+        self.loader = None
+        self.files_manifest = {}
+        self.load_args = None
 
 
-    def load_dataset(self, dataset_type: str, path: str, columns_to_keep=None):
-        from data_loading.loader_factory import get_loader
+    def load_dataset(self, dataset_type: str, path: str, columns_to_keep=None, profile: bool = False,
+                     sample_rows: int | None = None, reset_profiler: bool = True):
+        import pandas as pd
+        from data_loading.loader_factory import get_loader, get_status_loader
+        from data_loading.status_loader import join_status_intervals
         from wind_farm_data import WindFarmDataset
+        from utils.file_handler import get_files_manifest
+        from utils.instrumentation import profiler
 
-        loader = get_loader(dataset_type, path, columns_to_keep)
-        data_frame= loader.load_all()
-        self.dataset = WindFarmDataset(data_frame, dataset_type=dataset_type)
+        # derived frames (normalized) share unchanged columns with the preprocessed one, which is only safe
+        # with copy-on-write - the default from pandas 3, opt-in before; pandas is first imported here
+        if int(pd.__version__.split(".")[0]) < 3:
+            pd.set_option("mode.copy_on_write", True)
+
+        if reset_profiler:
+            profiler.reset()
+            if profile:
+                profiler.enable()
+            else:
+                profiler.disable()
+
+        loader = get_loader(dataset_type, path, columns_to_keep, sample_rows)
+        csv_files = loader.list_sources()
+        data_frame = loader.load_sources(csv_files)
+
+        status_intervals = get_status_loader(dataset_type, path).load_all()
+        if not status_intervals.empty:
+            data_frame = join_status_intervals(data_frame, status_intervals)
+
+        # anomaly detection is not part of loading, it runs on first use (analyze_anomalies)
+        dataset = WindFarmDataset(data_frame, dataset_type=dataset_type, flags=loader.flags, sampled=sample_rows is not None)
+
+        self.loader = loader
+        self.files_manifest = get_files_manifest(csv_files)
+        self.load_args = (dataset_type, path, columns_to_keep, profile)
+        # swapped last - a full load may run in the background while the sample is in use
+        self.dataset = dataset
+
+
+    def refresh_dataset(self) -> list[str]:
+        from data_loading.loader_factory import get_status_loader
+        from data_loading.status_loader import join_status_intervals
+        from utils.file_handler import get_files_manifest
+
+        if self.dataset is None or self.loader is None:
+            raise ValueError("Load a dataset first.")
+
+        if self.dataset.sampled:
+            raise ValueError("Quick-look dataset cannot be refreshed, load the full dataset first.")
+
+        csv_files = self.loader.list_sources()
+        changed_files = [file for file in csv_files if self.files_manifest.get(file.id) != file.signature]
+
+        if not changed_files:
+            return []
+
+        data_frame = self.loader.load_sources(changed_files)
+
+        status_intervals = get_status_loader(self.loader.dataset_type, self.loader.path).load_all()
+        if not status_intervals.empty:
+            data_frame = join_status_intervals(data_frame, status_intervals)
+
+        self.dataset.append_data(data_frame, self.loader.flags)
+        self.files_manifest.update(get_files_manifest(changed_files))
+
+        return [file.name for file in changed_files]
         
 
+    def load_full_dataset(self):
+        if self.dataset is None:
+            raise ValueError("Load a dataset first.")
+
+        # runs in a background thread - the profiler belongs to the GUI thread and is left as it is
+        self.load_dataset(*self.load_args, reset_profiler=False)
+
+
     def get_dataset(self):    
         return self.dataset
@@ -1,32 +1,100 @@
+from abc import ABC, abstractmethod
 from pathlib import Path
+import numpy as np
 import pandas as pd
-from sklearn.impute import KNNImputer
 
-from utils.file_handler import load_column_mapping, load_signal_ranges
+from utils.file_handler import ID_COLUMNS, CsvSource, list_csv_sources, load_column_mapping, load_signal_ranges, load_stuck_thresholds
+from utils.flag_store import FlagStore
+from utils.instrumentation import profile_stage, profiler
 
 
-class BaseLoader:
-    def __init__(self, path, dataset_type, columns_to_keep=None):
+class BaseLoader(ABC):
+    def __init__(self, path, dataset_type, columns_to_keep=None, sample_rows: int | None = None):
         self.path = Path(path)
         self.dataset_type = dataset_type
         self.columns_to_keep = columns_to_keep
 
+        # quick-look mode: total row budget, split evenly between the files
+        self.sample_rows = sample_rows
+        self.rows_per_file = None
+
+        # per-signal flags of the last loaded frame and of the file being loaded, row-aligned with them
+        self.flags = None
+        self.file_flags = None
+
 
     def load_all(self) -> pd.DataFrame:
+        return self.load_sources(self.list_sources())
+
+
+    def list_sources(self) -> list[CsvSource]:
+        return list_csv_sources(self.path)
+
+
+    @profile_stage()
+    def load_sources(self, csv_files: list[CsvSource]) -> pd.DataFrame:
+        if not csv_files:
+            raise FileNotFoundError(f"No CSV files in: {self.path}")
+
+        all_dfs = []
+        all_flags = []
+
+        if self.sample_rows is not None:
+            self.rows_per_file = max(1, -(-self.sample_rows // len(csv_files)))
+
+        for file in csv_files:
+            with profiler.scope(file=file.name):
+                all_dfs.append(self.load_file(file))
+                all_flags.append(self.file_flags)
+
+        with profiler.stage("concat") as stage:
+            data_frame = pd.concat(all_dfs, ignore_index=False)
+            self.flags = FlagStore.concat(all_flags)
+            stage.set_shape(data_frame)
+
+        return data_frame
+
+
+    @abstractmethod
+    def load_file(self, file: CsvSource) -> pd.DataFrame:
         pass
 
 
+    def get_skiprows(self, file: CsvSource, header_row: int = 0):
+        if self.sample_rows is None:
+            return header_row
+
+        # every n-th data row, so the sample covers the whole time range of the file
+        data_rows = file.count_lines() - header_row - 1
+        step = max(1, -(-data_rows // self.rows_per_file))
+
+        return lambda row: row < header_row or (row > header_row and (row - header_row - 1) % step != 0)
+
+
+    @profile_stage()
     def standarize_dataset(self, df: pd.DataFrame) -> pd.DataFrame:
         mapping = load_column_mapping(self.dataset_type)
 
         df = self.unify_signal_names(df, mapping)
         df = self.mark_invalid_data(df)
+
+        self.file_flags = FlagStore(len(df))
+        # sampled rows are not consecutive, runs of repeated values cannot be seen in them
+        if self.sample_rows is None:
+            df = self.mark_stuck_signals(df, flags=self.file_flags)
         df = self.add_anomaly_column(df)
-        df = self.fill_missing_values(df)
+
+        self.file_flags.set("invalid", "is_invalid", df["is_invalid"].to_numpy())
+        # sampled rows are n steps apart, interpolating between them would invent values - gaps are only flagged
+        if self.sample_rows is None:
+            df = self.fill_missing_values(df, flags=self.file_flags)
+        else:
+            self.mark_missing_values(df, self.file_flags)
 
         return df
 
 
+    @profile_stage()
     def unify_signal_names(self, df: pd.DataFrame, mapping: dict) -> pd.DataFrame:
         return df.rename(columns=mapping)
     
@@ -36,6 +104,7 @@ class BaseLoader:
         return df
 
 
+    @profile_stage()
     def mark_invalid_data(self, df: pd.DataFrame) -> pd.DataFrame:
         signals_ranges = load_signal_ranges()
         invalid_mask = pd.Series(False, index=df.index)
@@ -49,38 +118,81 @@ class BaseLoader:
         return df
     
 
+    @profile_stage()
+    def mark_stuck_signals(self, df: pd.DataFrame, period: str = "10min", flags: FlagStore | None = None) -> pd.DataFrame:
+        thresholds = load_stuck_thresholds()
+        default = thresholds.get("default")
+        signals = [col for col in df.select_dtypes(include='number').columns
+                   if col not in ID_COLUMNS and (col in thresholds or default is not None)]
+        if not signals or len(df) < 2:
+            return df
+
+        # rows in time order per turbine, runs do not continue across turbines or gaps in the data
+        times = pd.DatetimeIndex(pd.to_datetime(df.index, utc=True)).as_unit("ns").asi8
+        turbine_ids = df["turbine_id"].to_numpy() if "turbine_id" in df.columns else np.zeros(len(df))
+        order = np.lexsort((times, turbine_ids))
+        times = times[order]
+        turbine_ids = turbine_ids[order]
+
+        # signal-major, so the scans below run over contiguous memory
+        values = np.ascontiguousarray(df[signals].to_numpy(dtype=float)[order].T)
+        limits = np.array([thresholds.get(col, default) for col in signals], dtype=float)[:, None]
+
+        breaks = (turbine_ids[1:] != turbine_ids[:-1]) | (np.diff(times) != pd.Timedelta(period).value)
+        # equal to the previous row, NaNs never are
+        repeated = np.zeros(values.shape, dtype=bool)
+        repeated[:, 1:] = (values[:, 1:] == values[:, :-1]) & ~breaks
+
+        # run-length encoding of all signals at once: first and last row of the run every row belongs to
+        rows = np.arange(values.shape[1])
+        run_start = np.maximum.accumulate(np.where(repeated, 0, rows), axis=1)
+        continues = np.zeros(values.shape, dtype=bool)
+        continues[:, :-1] = repeated[:, 1:]
+        run_end = np.minimum.accumulate(np.where(continues, len(rows), rows)[:, ::-1], axis=1)[:, ::-1]
+
+        stuck = np.empty(values.shape, dtype=bool)
+        stuck[:, order] = (run_end - run_start + 1) > limits
+
+        if flags is not None:
+            for i, col in enumerate(signals):
+                flags.set("stuck", col, stuck[i])
+
+        df["is_invalid"] = df["is_invalid"].to_numpy() | stuck.any(axis=0)
+        return df
+
+
     def select_columns(self, dataframe: pd.DataFrame) -> pd.DataFrame:
         if self.columns_to_keep:
             selected_columns = [col for col in self.columns_to_keep if col in dataframe.columns]
+            # flags were built for every signal of the file, the dropped ones go with their columns
+            if self.file_flags is not None:
+                self.file_flags.drop_signals([col for col in dataframe.columns if col not in selected_columns])
             return dataframe[selected_columns]
         
         return dataframe
 
 
-    def create_imputation_mask(self, df: pd.DataFrame, max_nan_sequence_length: int) -> pd.DataFrame:
-        df_to_impute_mask = pd.DataFrame(False, index=df.index, columns=df.columns)
+    def create_imputation_mask(self, is_nan: np.ndarray, max_nan_sequence_length: int) -> np.ndarray:
+        # lengths of the runs of equal values, repeated for every row of the run
+        run_starts = np.flatnonzero(np.diff(is_nan, prepend=~is_nan[:1]))
+        run_lengths = np.diff(np.append(run_starts, len(is_nan)))
 
-        for col in df.select_dtypes(include='number').columns:
-            is_nan = df[col].isna()
+        return is_nan & (np.repeat(run_lengths, run_lengths) <= max_nan_sequence_length)
 
-            # Next group starts when value change
-            group_id = (is_nan != is_nan.shift(1)).cumsum()
 
-            group_lengths = group_id.groupby(group_id).transform('count')
-
-            imputation_mask = is_nan & (group_lengths <= max_nan_sequence_length)        
-            df_to_impute_mask[col] = imputation_mask
+    def mark_missing_values(self, df: pd.DataFrame, flags: FlagStore):
+        for col in df.select_dtypes(include='number').columns:
+            flags.set("missing", col, df[col].isna().to_numpy())
 
-        return df_to_impute_mask
-    
 
-    def fill_missing_values(self, df: pd.DataFrame, method="interpolation", n_neighbors=3, max_nan_sequence_length=3) -> pd.DataFrame:
+    @profile_stage()
+    def fill_missing_values(self, df: pd.DataFrame, method="interpolation", n_neighbors=3, max_nan_sequence_length=3,
+                            flags: FlagStore | None = None) -> pd.DataFrame:
         numeric_cols = df.select_dtypes(include='number').columns
 
-        if method == "interpolation":
-            df_imputed = df[numeric_cols].interpolate(method='linear', limit=2, limit_direction='both')
+        if method == "knn":
+            from sklearn.impute import KNNImputer
 
-        elif method == "knn":
             imputer = KNNImputer(n_neighbors=n_neighbors, weights='distance')
 
             imputed_values = imputer.fit_transform(df[numeric_cols])
@@ -90,10 +202,22 @@ class BaseLoader:
                 columns=numeric_cols
             )
 
-        imputation_mask = self.create_imputation_mask(df, max_nan_sequence_length)
-        imputation_mask_numeric = imputation_mask[numeric_cols]
-
+        # masks built one column at a time and packed straight into the flags, no boolean frames
         for col in numeric_cols:
-            df.loc[imputation_mask_numeric[col], col] = df_imputed.loc[imputation_mask_numeric[col], col]
+            is_nan = df[col].isna().to_numpy()
+            if flags is not None:
+                flags.set("missing", col, is_nan)
+
+            imputation_mask = self.create_imputation_mask(is_nan, max_nan_sequence_length)
+            if imputation_mask.any():
+                if method == "interpolation":
+                    imputed = df[col].interpolate(method='linear', limit=2, limit_direction='both')
+                elif method == "knn":
+                    imputed = df_imputed[col]
+
+                df.loc[imputation_mask, col] = imputed.to_numpy()[imputation_mask]
+
+            if flags is not None:
+                flags.set("imputed", col, imputation_mask & df[col].notna().to_numpy())
 
         return df
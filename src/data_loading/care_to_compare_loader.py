@@ -1,28 +1,29 @@
 import pandas as pd
+from utils.file_handler import CsvSource, list_csv_sources
+from utils.instrumentation import profiler
 from .base_loader import BaseLoader
 
 class CareToCompareLoader(BaseLoader):
 
-    def load_all(self) -> pd.DataFrame:
-        all_dfs = []
-        csv_files = sorted(self.path.glob("*.csv"))
-        
-        if not csv_files:
-            raise FileNotFoundError(f"No CSV files in folder: {self.path}")
+    def list_sources(self) -> list[CsvSource]:
+        # event_info.csv and feature_description.csv describe the farm, they are not SCADA data
+        return [file for file in list_csv_sources(self.path) if file.stem not in ("event_info", "feature_description")]
+
 
-        for file in csv_files:
-            data_frame = pd.read_csv(
-                file, 
-                sep=";", 
-                low_memory=False)
+    def load_file(self, file: CsvSource) -> pd.DataFrame:
+        with profiler.stage("read_csv") as stage:
+            with file.open() as stream:
+                data_frame = pd.read_csv(
+                    stream, 
+                    sep=";", 
+                    skiprows=self.get_skiprows(file),
+                    low_memory=False)
         
             data_frame["time_stamp"] = pd.to_datetime(data_frame["time_stamp"], format="%Y-%m-%d  %H:%M:%S", errors="coerce")
             data_frame = data_frame.dropna(subset=["time_stamp"])
             data_frame = data_frame.set_index("time_stamp")
+            stage.set_shape(data_frame)
 
-            data_frame = self.standarize_dataset(data_frame)
-
-            data_frame = self.select_columns(data_frame)
-            all_dfs.append(data_frame)
+        data_frame = self.standarize_dataset(data_frame)
 
-        return pd.concat(all_dfs, ignore_index=False)
+        return self.select_columns(data_frame)
@@ -1,37 +1,35 @@
 import re
 import pandas as pd
+from utils.file_handler import CsvSource, list_csv_sources
+from utils.instrumentation import profiler
 from .base_loader import BaseLoader
 
 
 class GreenbyteLoader(BaseLoader):
-    def load_all(self) -> pd.DataFrame:
-        all_dfs = []
-        csv_files = sorted(self.path.glob("*.csv"))
+    def list_sources(self) -> list[CsvSource]:
+        return [file for file in list_csv_sources(self.path) if "Data" in file.name]
 
-        if not csv_files:
-            raise FileNotFoundError(f"No CSV files in folder: {self.path}")
 
-        for file in csv_files:
-            if "Data" in file.name:
-                turbine_number = re.search(r'(\d+)', file.stem)
-                turbine_id = turbine_number.group(1) if turbine_number else "unknown"
+    def load_file(self, file: CsvSource) -> pd.DataFrame:
+        turbine_number = re.search(r'(\d+)', file.stem)
+        turbine_id = turbine_number.group(1) if turbine_number else "unknown"
 
+        with profiler.stage("read_csv") as stage:
+            with file.open() as stream:
                 data_frame = pd.read_csv(
-                    file,
-                    skiprows=9,
+                    stream,
+                    skiprows=self.get_skiprows(file, header_row=9),
                     low_memory=False,
                     index_col="# Date and time"
                 )
 
-                data_frame.index = pd.to_datetime(data_frame.index, utc=True, errors='coerce')
-                data_frame = data_frame[data_frame["Data Availability"] == 1]
-                data_frame = data_frame.dropna(axis=1, how='all')
+            data_frame.index = pd.to_datetime(data_frame.index, utc=True, errors='coerce')
+            data_frame = data_frame[data_frame["Data Availability"] == 1]
+            data_frame = data_frame.dropna(axis=1, how='all')
+            stage.set_shape(data_frame)
 
-                data_frame = self.standarize_dataset(data_frame)
+        data_frame = self.standarize_dataset(data_frame)
 
-                data_frame["turbine_id"] = int(turbine_id)
+        data_frame["turbine_id"] = int(turbine_id)
 
-                data_frame = self.select_columns(data_frame)
-                all_dfs.append(data_frame)
-
-        return pd.concat(all_dfs, ignore_index=False)
+        return self.select_columns(data_frame)
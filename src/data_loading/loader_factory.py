@@ -1,19 +1,34 @@
 from data_loading.care_to_compare_loader import CareToCompareLoader
 from .base_loader import BaseLoader
 from .greenbyte_loader import GreenbyteLoader
+from .status_loader import CareToCompareEventLoader, GreenbyteStatusLoader
 
 
-def get_loader(dataset_name: str, path: str, columns_to_keep=None) -> BaseLoader:
+def get_loader(dataset_name: str, path: str, columns_to_keep=None, sample_rows: int | None = None) -> BaseLoader:
     dataset_name = dataset_name.lower()
 
     if dataset_name == "kelmarsh":
-        return GreenbyteLoader(path, dataset_name, columns_to_keep)
+        return GreenbyteLoader(path, dataset_name, columns_to_keep, sample_rows)
       
     elif dataset_name == "penmanshiel":
-        return GreenbyteLoader(path, dataset_name, columns_to_keep)
+        return GreenbyteLoader(path, dataset_name, columns_to_keep, sample_rows)
     
     elif dataset_name.startswith("caretocompare"):
-        return CareToCompareLoader(path, dataset_name, columns_to_keep)    
+        return CareToCompareLoader(path, dataset_name, columns_to_keep, sample_rows)    
     
     else:
         raise ValueError(f"Unknown dataset type: {dataset_name}")
+
+
+
+def get_status_loader(dataset_name: str, path: str):
+    dataset_name = dataset_name.lower()
+
+    if dataset_name in ("kelmarsh", "penmanshiel"):
+        return GreenbyteStatusLoader(path)
+
+    elif dataset_name.startswith("caretocompare"):
+        return CareToCompareEventLoader(path)
+
+    else:
+        raise ValueError(f"Unknown dataset type: {dataset_name}")
@@ -0,0 +1,135 @@
+import re
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from utils.file_handler import list_csv_sources
+from utils.instrumentation import profile_stage
+
+
+STATUS_COLUMNS = ["turbine_id", "start", "end", "status", "category"]
+
+
+class GreenbyteStatusLoader:
+    def __init__(self, path):
+        self.path = Path(path)
+
+
+    @profile_stage("load_status")
+    def load_all(self) -> pd.DataFrame:
+        all_dfs = []
+
+        for file in list_csv_sources(self.path):
+            if "Status" in file.name:
+                turbine_number = re.search(r'(\d+)', file.stem)
+                turbine_id = turbine_number.group(1) if turbine_number else "unknown"
+
+                with file.open() as stream:
+                    status_df = pd.read_csv(stream, skiprows=9, low_memory=False)
+
+                category_col = "IEC category" if "IEC category" in status_df.columns else "Status"
+                all_dfs.append(pd.DataFrame({
+                    "turbine_id": int(turbine_id),
+                    "start": pd.to_datetime(status_df["Timestamp start"], utc=True, errors="coerce"),
+                    # "-" marks a status that was still active at export time
+                    "end": pd.to_datetime(status_df["Timestamp end"], utc=True, errors="coerce"),
+                    "status": status_df["Message"].astype(str),
+                    "category": status_df[category_col].astype(str),
+                }))
+
+        if not all_dfs:
+            return pd.DataFrame(columns=STATUS_COLUMNS)
+
+        return pd.concat(all_dfs, ignore_index=True).dropna(subset=["start"])
+
+
+class CareToCompareEventLoader:
+    def __init__(self, path):
+        self.path = Path(path)
+
+
+    @profile_stage("load_status")
+    def load_all(self) -> pd.DataFrame:
+        # event_info.csv sits in the wind farm folder, next to or one level above the datasets folder
+        sources = [file for file in list_csv_sources(self.path) if file.stem == "event_info"]
+        if not sources and self.path.is_dir():
+            sources = [file for file in list_csv_sources(self.path.parent) if file.stem == "event_info"]
+
+        if not sources:
+            return pd.DataFrame(columns=STATUS_COLUMNS)
+
+        with sources[0].open() as stream:
+            events_df = pd.read_csv(stream, sep=";", low_memory=False)
+
+        asset_col = "asset_id" if "asset_id" in events_df.columns else "asset"
+        description = events_df["event_description"] if "event_description" in events_df.columns else events_df["event_label"]
+
+        events = pd.DataFrame({
+            "turbine_id": events_df[asset_col],
+            "start": pd.to_datetime(events_df["event_start"], errors="coerce"),
+            "end": pd.to_datetime(events_df["event_end"], errors="coerce"),
+            "status": description.fillna(events_df["event_label"]).astype(str),
+            "category": events_df["event_label"].astype(str),
+        })
+
+        return events.dropna(subset=["start"])
+
+
+def to_nanoseconds(timestamps, tz) -> np.ndarray:
+    timestamps = pd.DatetimeIndex(timestamps)
+
+    if tz is not None and timestamps.tz is None:
+        timestamps = timestamps.tz_localize(tz)
+    elif tz is None and timestamps.tz is not None:
+        timestamps = timestamps.tz_convert(None)
+
+    return timestamps.as_unit("ns").asi8
+
+
+@profile_stage()
+def join_status_intervals(df: pd.DataFrame, intervals: pd.DataFrame, period: str = "10min") -> pd.DataFrame:
+    status_codes, status_names = pd.factorize(intervals["status"])
+    category_codes, category_names = pd.factorize(intervals["category"])
+
+    row_status = np.full(len(df), -1, dtype=np.int64)
+    row_category = np.full(len(df), -1, dtype=np.int64)
+
+    tz = getattr(df.index, "tz", None)
+    row_times = to_nanoseconds(df.index, tz)
+    period_ns = pd.Timedelta(period).value
+
+    starts_all = to_nanoseconds(intervals["start"], tz)
+    ends_all = to_nanoseconds(intervals["end"], tz)
+    ends_all = np.where(intervals["end"].isna().to_numpy(), np.iinfo(np.int64).max, ends_all)
+
+    interval_groups = intervals.groupby("turbine_id").indices
+    row_groups = df.groupby("turbine_id").indices
+
+    for turbine_id, row_positions in row_groups.items():
+        interval_positions = interval_groups.get(turbine_id)
+        if interval_positions is None:
+            continue
+
+        order = interval_positions[np.argsort(starts_all[interval_positions], kind="stable")]
+        starts = starts_all[order]
+        ends = ends_all[order]
+
+        # interval reaching furthest up to each position - catches long events overlapped by shorter later ones
+        furthest_end = np.maximum.accumulate(ends)
+        furthest_arg = np.maximum.accumulate(np.where(ends >= furthest_end, np.arange(len(ends)), 0))
+
+        # a row covers [t, t + period) and overlaps every interval starting before t + period and ending after t
+        times = row_times[row_positions]
+        last_started = np.searchsorted(starts, times + period_ns, side="left") - 1
+        has_started = last_started >= 0
+        last_started = np.maximum(last_started, 0)
+
+        active = np.where(ends[last_started] > times, last_started, furthest_arg[last_started])
+        is_active = has_started & (ends[active] > times)
+
+        matched = order[active[is_active]]
+        row_status[row_positions[is_active]] = status_codes[matched]
+        row_category[row_positions[is_active]] = category_codes[matched]
+
+    df["status"] = pd.Categorical.from_codes(row_status, categories=status_names)
+    df["status_category"] = pd.Categorical.from_codes(row_category, categories=category_names)
+    return df
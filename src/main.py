@@ -1,8 +1,75 @@
-from utils.gui_helpers import DataLoaderGUI
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
 from app_state import AppState
 
 
+# modules imported at start-up and the ones deferred until a feature needs them
+STARTUP_MODULES = ["utils.gui_helpers"]
+DEFERRED_MODULES = ["wind_farm_data", "data_loading.loader_factory", "plots", "scipy.cluster.hierarchy", "sklearn.impute"]
+
+
+def measure_import_times(module: str) -> tuple[int, list[tuple[str, int]]]:
+    # fresh interpreter per module, so nothing is cached by an earlier import
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(Path(__file__).parent), os.environ.get("PYTHONPATH")])))
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            capture_output=True, text=True, env=env)
+    if result.returncode != 0:
+        raise ImportError(result.stderr.strip().splitlines()[-1])
+
+    # "import time: self [us] | cumulative | imported package" - nested imports are indented by two
+    # spaces and printed before the module that imported them, the measured module comes last
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((depth, name.strip(), int(cumulative)))
+
+    total = entries[-1][2]
+    # direct imports of the measured module, back to the previous top-level (interpreter start-up) entry
+    imports = []
+    for depth, name, cumulative in reversed(entries[:-1]):
+        if depth == 0:
+            break
+        if depth == 1:
+            imports.append((name, cumulative))
+
+    return total, imports
+
+
+def report_import_times(limit: int = 8):
+    for title, modules in (("Start-up", STARTUP_MODULES), ("Deferred until used", DEFERRED_MODULES)):
+        print(f"{title}:")
+
+        for module in modules:
+            try:
+                total, imports = measure_import_times(module)
+            except ImportError as e:
+                print(f"  {module:<38} not available ({e})")
+                continue
+
+            print(f"  {module:<38} {total / 1000:>9.1f} ms")
+            for name, time in sorted(imports, key=lambda item: item[1], reverse=True)[:limit]:
+                print(f"    {name:<36} {time / 1000:>9.1f} ms")
+
+
 def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--import-times", action="store_true", help="report import cost per module instead of starting the GUI")
+    args = parser.parse_args()
+
+    if args.import_times:
+        report_import_times()
+        return
+
+    from utils.gui_helpers import DataLoaderGUI
+
     state = AppState()
     DataLoaderGUI(state)
 
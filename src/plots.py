@@ -63,7 +63,7 @@ def plot_data_uptime(df: pd.DataFrame, turbine_id: str = "all", expected_interva
     plt.show()
 
 
-def plot_variable_boxplot(df: pd.DataFrame, parameter: str, turbine_id: str = "all"):
+def plot_variable_boxplot(df: pd.DataFrame, parameter: str, turbine_id: str = "all", stats: list[dict] | None = None):
     if parameter not in df.columns:
         raise ValueError(f"Column '{parameter}' not found in dataset.")
 
@@ -74,7 +74,11 @@ def plot_variable_boxplot(df: pd.DataFrame, parameter: str, turbine_id: str = "a
     title = f"Distribution of {parameter} for {plot_scope}"
 
     fig, ax = plt.subplots(figsize=(10, 5), num=f"Distribution Boxplot of {parameter} for {plot_scope}")
-    df.boxplot(column=parameter, by="turbine_id", ax=ax, grid=False)
+    if stats is not None:
+        # precomputed (e.g. approximate) statistics, no pass over the data
+        ax.bxp(stats, showfliers=False)
+    else:
+        df.boxplot(column=parameter, by="turbine_id", ax=ax, grid=False)
     ax.set_title(title)
     ax.set_xlabel("Turbine ID")
     ax.set_ylabel(parameter)
@@ -187,3 +191,28 @@ def plot_correlation_matrix(correlation_matrix: pd.DataFrame, plot_labels=True):
     plt.title('Correlation Matrix')
     plt.tight_layout()
     plt.show()
+
+
+def plot_power_curve(curve: pd.DataFrame, turbine_id: str = "all"):
+    plot_scope = get_plot_scope(turbine_id)
+
+    if turbine_id.lower() != "all":
+        curve = curve[curve["turbine_id"] == int(turbine_id)]
+
+    fig, ax = plt.subplots(figsize=(10, 6), num=f"Power Curve for {plot_scope}")
+
+    for id, turbine_curve in curve.groupby("turbine_id"):
+        line, = ax.plot(turbine_curve["wind_speed_bin"], turbine_curve["power_mean"], label=f"T{id}")
+
+        if "power_q10" in turbine_curve.columns and "power_q90" in turbine_curve.columns:
+            ax.fill_between(turbine_curve["wind_speed_bin"], turbine_curve["power_q10"], turbine_curve["power_q90"],
+                            color=line.get_color(), alpha=0.15)
+
+    ax.set_xlabel("Wind speed (m/s)")
+    ax.set_ylabel("Power (kW)")
+    ax.set_title(f"Binned Power Curve for {plot_scope}")
+    ax.legend(loc="best")
+    ax.grid(True, linestyle="--", alpha=0.3)
+
+    plt.tight_layout()
+    plt.show()
@@ -1,4 +1,12 @@
+import gzip
 import json
+import zipfile
+from contextlib import contextmanager
+from pathlib import Path, PurePosixPath
+
+
+# identifiers in the unified signal names - numeric, but not signals
+ID_COLUMNS = ["turbine_id", "record_id", "status_type_id"]
 
 
 def load_column_mapping(dataset_name: str) -> dict:
@@ -16,4 +24,83 @@ def load_signal_ranges() -> dict[str, list[float]]:
     with open(path, 'r', encoding="utf-8") as signals_ranges:
         ranges = json.load(signals_ranges)
 
-    return ranges
\ No newline at end of file
+    return ranges
+
+
+def load_stuck_thresholds() -> dict[str, int]:
+    path = "config/signals_stuck_thresholds.json"
+
+    with open(path, 'r', encoding="utf-8") as stuck_thresholds:
+        thresholds = json.load(stuck_thresholds)
+
+    return thresholds
+
+class CsvSource:
+    def __init__(self, path: Path, member: str | None = None, signature: tuple | None = None):
+        self.path = Path(path)
+        self.member = member
+
+        # name as the loaders see it - for archive members only the file name, without folders
+        self.name = PurePosixPath(member).name if member else self.path.name
+        self.stem = self.name.removesuffix(".gz").removesuffix(".csv")
+        self.id = f"{self.path}::{member}" if member else str(self.path)
+
+        # changes when the file content changes - (mtime, size) on disk, (crc, size) inside an archive
+        if signature is None and member is None:
+            stat = self.path.stat()
+            signature = (stat.st_mtime_ns, stat.st_size)
+        self.signature = signature
+
+
+    def __repr__(self) -> str:
+        return f"CsvSource({self.id})"
+
+
+    def count_lines(self) -> int:
+        # newlines only, without parsing - far cheaper than reading the file with pandas
+        with self.open() as stream:
+            return sum(chunk.count(b"\n") for chunk in iter(lambda: stream.read(1 << 20), b""))
+
+
+    @contextmanager
+    def open(self):
+        if self.member:
+            with zipfile.ZipFile(self.path) as archive, archive.open(self.member) as stream:
+                yield stream
+
+        elif self.name.endswith(".gz"):
+            with gzip.open(self.path, "rb") as stream:
+                yield stream
+
+        else:
+            with open(self.path, "rb") as stream:
+                yield stream
+
+
+def is_csv_name(name: str) -> bool:
+    return name.lower().endswith((".csv", ".csv.gz"))
+
+
+def list_csv_sources(path: str | Path) -> list[CsvSource]:
+    path = Path(path)
+
+    if path.is_file() and zipfile.is_zipfile(path):
+        archives, plain_files = [path], []
+    elif path.is_file():
+        archives, plain_files = [], [path] if is_csv_name(path.name) else []
+    else:
+        archives = sorted(file for file in path.glob("*.zip"))
+        plain_files = sorted(file for file in path.iterdir() if file.is_file() and is_csv_name(file.name))
+
+    sources = [CsvSource(file) for file in plain_files]
+
+    for archive_path in archives:
+        with zipfile.ZipFile(archive_path) as archive:
+            members = [info for info in archive.infolist() if not info.is_dir() and is_csv_name(info.filename)]
+        sources.extend(CsvSource(archive_path, info.filename, (info.CRC, info.file_size)) for info in members)
+
+    return sorted(sources, key=lambda source: source.name)
+
+
+def get_files_manifest(sources: list[CsvSource]) -> dict[str, tuple]:
+    return {source.id: source.signature for source in sources}
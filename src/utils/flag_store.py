@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+
+
+class FlagStore:
+    # Per-signal boolean flags (outlier, imputed, missing, invalid) kept as np.packbits arrays -
+    # one bit per row instead of one byte in a boolean DataFrame.
+    def __init__(self, n_rows: int):
+        self.n_rows = n_rows
+        self.flags = {}
+
+
+    def set(self, flag: str, signal: str, mask: np.ndarray):
+        mask = np.asarray(mask, dtype=bool)
+        if len(mask) != self.n_rows:
+            raise ValueError(f"Flag '{flag}' for '{signal}' has {len(mask)} rows, expected {self.n_rows}.")
+
+        self.flags.setdefault(flag, {})[signal] = np.packbits(mask)
+
+
+    def get(self, flag: str, signal: str) -> np.ndarray:
+        packed = self.flags.get(flag, {}).get(signal)
+        if packed is None:
+            return np.zeros(self.n_rows, dtype=bool)
+
+        return np.unpackbits(packed, count=self.n_rows).view(bool)
+
+
+    def get_signals(self, flag: str) -> list[str]:
+        return list(self.flags.get(flag, {}))
+
+
+    def count(self, flag: str) -> pd.Series:
+        counts = {signal: int(np.unpackbits(packed, count=self.n_rows).sum()) for signal, packed in self.flags.get(flag, {}).items()}
+        return pd.Series(counts, dtype=np.int64, name=flag)
+
+
+    def percent_by_group(self, flag: str, group_labels: np.ndarray) -> pd.DataFrame:
+        codes, groups = pd.factorize(group_labels, sort=True)
+        group_sizes = np.bincount(codes, minlength=len(groups))
+        signals = self.get_signals(flag)
+
+        counts = np.zeros((len(signals), len(groups)), dtype=np.int64)
+        for i, signal in enumerate(signals):
+            counts[i] = np.bincount(codes[self.get(flag, signal)], minlength=len(groups))
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            percent = 100 * counts / group_sizes
+
+        return pd.DataFrame(percent, index=pd.Index(signals, name="signal"), columns=groups).round(2)
+
+
+    def drop_signals(self, signals: list[str]):
+        for flag_signals in self.flags.values():
+            for signal in signals:
+                flag_signals.pop(signal, None)
+
+
+    def take(self, positions: np.ndarray) -> "FlagStore":
+        store = FlagStore(len(positions))
+        for flag, flag_signals in self.flags.items():
+            for signal in flag_signals:
+                store.set(flag, signal, self.get(flag, signal)[positions])
+
+        return store
+
+
+    @staticmethod
+    def concat(stores: list["FlagStore"]) -> "FlagStore":
+        store = FlagStore(sum(part.n_rows for part in stores))
+
+        # a flag missing in one of the parts (e.g. signal not present in that file) is False there
+        keys = {(flag, signal) for part in stores for flag, flag_signals in part.flags.items() for signal in flag_signals}
+        for flag, signal in sorted(keys):
+            store.set(flag, signal, np.concatenate([part.get(flag, signal) for part in stores]))
+
+        return store
+
+
+    def memory_usage(self) -> pd.DataFrame:
+        rows = []
+        for flag, flag_signals in self.flags.items():
+            rows.append({
+                "flag": flag,
+                "signals": len(flag_signals),
+                "packed_bytes": sum(packed.nbytes for packed in flag_signals.values()),
+                "bool_frame_bytes": len(flag_signals) * self.n_rows,
+            })
+
+        return pd.DataFrame(rows, columns=["flag", "signals", "packed_bytes", "bool_frame_bytes"])
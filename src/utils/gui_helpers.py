@@ -1,24 +1,36 @@
+import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
+from typing import TYPE_CHECKING
 
-import pandas as pd
 from app_state import AppState
-from plots import plot_correlation_matrix, plot_data_uptime, plot_variable_boxplot, plot_variable_histogram, plot_variable_timeline
-from wind_farm_data import WindFarmDataset
+from utils.instrumentation import profiler
+
+# pandas, matplotlib and the analysis modules are imported when first used, so the loader window
+# opens without them
+if TYPE_CHECKING:
+    import pandas as pd
+    from wind_farm_data import WindFarmDataset
+
+QUICK_LOOK_ROWS = 200_000
 
 class DataLoaderGUI:
     def __init__(self, state: AppState):
         self.app_state = state
         self.root = tk.Tk()
         self.root.title("Wind Farm Dataset Loader")
-        self.root.geometry("480x420")
+        self.root.geometry("480x450")
 
         ttk.Label(self.root, text="Dataset Loader", font=("Segoe UI", 13, "bold")).pack(pady=10)
 
         self.path_to_data_folder = tk.StringVar()
-        ttk.Label(self.root, text="Path to dataset folder:").pack(pady=4)
+        ttk.Label(self.root, text="Path to dataset folder or archive:").pack(pady=4)
         ttk.Entry(self.root, textvariable=self.path_to_data_folder, width=55).pack()
-        ttk.Button(self.root, text="Select folder", command=self.select_folder).pack(pady=5)
+
+        select_frame = ttk.Frame(self.root)
+        select_frame.pack(pady=5)
+        ttk.Button(select_frame, text="Select folder", command=self.select_folder).pack(side=tk.LEFT, padx=5)
+        ttk.Button(select_frame, text="Select archive", command=self.select_archive).pack(side=tk.LEFT, padx=5)
 
         ttk.Label(self.root, text="Dataset type:").pack(pady=4)
         self.dataset_type = tk.StringVar(value="Kelmarsh")
@@ -34,6 +46,12 @@ class DataLoaderGUI:
         checkbox = tk.Checkbutton(self.root, text="Show data preview", variable=self.show_preview)
         checkbox.pack(pady=10)
 
+        self.profile_pipeline = tk.BooleanVar()
+        tk.Checkbutton(self.root, text="Profile loading and analysis", variable=self.profile_pipeline).pack()
+
+        self.quick_look = tk.BooleanVar()
+        tk.Checkbutton(self.root, text=f"Quick look (sample of {QUICK_LOOK_ROWS:,} rows)", variable=self.quick_look).pack()
+
         ttk.Button(self.root, text="Load dataset", command=self.load_data).pack(pady=15)
 
         self.output_label = tk.Label(self.root, text="", fg="green")
@@ -46,6 +64,11 @@ class DataLoaderGUI:
         if folder:
             self.path_to_data_folder.set(folder)
 
+    def select_archive(self):
+        archive = filedialog.askopenfilename(filetypes=[("Archives and CSV files", "*.zip *.csv *.gz")])
+        if archive:
+            self.path_to_data_folder.set(archive)
+
     def load_data(self):
         folder_path = self.path_to_data_folder.get()
         dataset_type = self.dataset_type.get()
@@ -53,10 +76,13 @@ class DataLoaderGUI:
         columns_to_keep = [col.strip() for col in cols.split(",")] if cols else None
 
         try:
-            self.app_state.load_dataset(dataset_type, folder_path, columns_to_keep)
+            sample_rows = QUICK_LOOK_ROWS if self.quick_look.get() else None
+            self.app_state.load_dataset(dataset_type, folder_path, columns_to_keep, profile=self.profile_pipeline.get(),
+                                        sample_rows=sample_rows)
             dataset = self.app_state.get_dataset()
             data_frame = dataset.get_dataframe()
-            self.output_label.config(text=f"Loaded dataset of: {len(data_frame)} records, {len(data_frame.columns)} columns")
+            sampled_info = " (sampled)" if dataset.sampled else ""
+            self.output_label.config(text=f"Loaded dataset of: {len(data_frame)} records{sampled_info}, {len(data_frame.columns)} columns")
             # messagebox.showinfo("Success", f"Successfully loaded dataset ({len(data_frame)} records).")
 
             if self.show_preview.get():
@@ -67,7 +93,9 @@ class DataLoaderGUI:
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
-    def preview_dataframe(self, data_frame: pd.DataFrame, limit=10):
+    def preview_dataframe(self, data_frame: "pd.DataFrame", limit=10):
+        import pandas as pd
+
         if data_frame is None or data_frame.empty:
             messagebox.showwarning("No data loaded", "No data to preview.")
             return
@@ -118,15 +146,16 @@ class DataLoaderGUI:
 
 
 class DataAnalysisGUI:
-    def __init__(self, app_state: AppState, dataset: WindFarmDataset):
+    def __init__(self, app_state: AppState, dataset: "WindFarmDataset"):
         self.app_state = app_state
         self.dataset = dataset
         self.df = dataset.get_dataframe()
         self.selected_parameter = None
 
         self.analysis_frames = {}
+        self.full_load = None
         self.root = tk.Toplevel()
-        self.root.title("Wind Farm Data Analysis")
+        self.root.title("Wind Farm Data Analysis (quick look)" if dataset.sampled else "Wind Farm Data Analysis")
         self.root.geometry("1000x600")
 
         ttk.Label(self.root, text="Data Analysis Overview", font=("Segoe UI", 13, "bold")).pack(pady=10)
@@ -140,6 +169,28 @@ class DataAnalysisGUI:
         turbines = ["all"] + sorted(turbines_list)
         ttk.Combobox(options_frame, textvariable=self.selected_turbine, values=turbines).pack(side=tk.LEFT, pady=6)
 
+        self.approximate_statistics = tk.BooleanVar()
+        tk.Checkbutton(
+            options_frame,
+            text="Approximate statistics",
+            variable=self.approximate_statistics,
+            command=lambda: self.dataset.set_statistics_mode("approximate" if self.approximate_statistics.get() else "exact")
+        ).pack(side=tk.LEFT, padx=5)
+
+        ttk.Button(
+            options_frame,
+            text="Refresh Data",
+            command=self.refresh_data
+        ).pack(side=tk.LEFT, padx=5)
+
+        if dataset.sampled:
+            self.full_load_button = ttk.Button(
+                options_frame,
+                text="Load Full Data",
+                command=self.start_full_load
+            )
+            self.full_load_button.pack(side=tk.LEFT, padx=5)
+
 
         button_frame = ttk.Frame(self.root)
         button_frame.pack(pady=5)
@@ -156,10 +207,34 @@ class DataAnalysisGUI:
             command=lambda: self.run_analysis(type="variable", turbine_id=self.selected_turbine.get())
         ).pack(side=tk.LEFT, padx=5)
 
+        ttk.Button(
+            button_frame,
+            text="Imputation Analysis",
+            command=lambda: self.run_analysis(type="imputed", turbine_id=self.selected_turbine.get())
+        ).pack(side=tk.LEFT, padx=5)
+
+        ttk.Button(
+            button_frame,
+            text="Anomaly Detection",
+            command=lambda: self.run_analysis(type="anomaly", turbine_id=self.selected_turbine.get())
+        ).pack(side=tk.LEFT, padx=5)
+
+        ttk.Button(
+            button_frame,
+            text="Stuck Signals Analysis",
+            command=lambda: self.run_analysis(type="stuck", turbine_id=self.selected_turbine.get())
+        ).pack(side=tk.LEFT, padx=5)
+
+        ttk.Button(
+            button_frame,
+            text="Status Analysis",
+            command=lambda: self.run_analysis(type="status", turbine_id=self.selected_turbine.get())
+        ).pack(side=tk.LEFT, padx=5)
+
         ttk.Button(
             button_frame, 
             text="Plot Data Availability", 
-            command=lambda: plot_data_uptime(self.df, turbine_id=self.selected_turbine.get())
+            command=self.on_plot_uptime
         ).pack(side=tk.LEFT, padx=5)
 
         ttk.Button(
@@ -181,13 +256,50 @@ class DataAnalysisGUI:
         ).pack(side=tk.LEFT, padx=5)
 
 
+        power_curve_frame = ttk.Frame(self.root)
+        power_curve_frame.pack(pady=5)
+
+        ttk.Button(
+            power_curve_frame,
+            text="Power Curve Analysis",
+            command=lambda: self.run_analysis(type="power_curve", turbine_id=self.selected_turbine.get())
+        ).pack(side=tk.LEFT, padx=5)
+
+        ttk.Button(
+            power_curve_frame,
+            text="Plot Power Curve",
+            command=self.on_plot_power_curve
+        ).pack(side=tk.LEFT, padx=5)
+
+        ttk.Button(
+            power_curve_frame,
+            text="Memory Usage",
+            command=lambda: self.run_analysis(type="memory")
+        ).pack(side=tk.LEFT, padx=5)
+
+        if profiler.enabled:
+            tk.Label(power_curve_frame, text="  |  ").pack(side=tk.LEFT, pady=6)
+
+            ttk.Button(
+                power_curve_frame,
+                text="Pipeline Profile",
+                command=lambda: self.run_analysis(type="profile")
+            ).pack(side=tk.LEFT, padx=5)
+
+            ttk.Button(
+                power_curve_frame,
+                text="Export Profile",
+                command=self.export_profile
+            ).pack(side=tk.LEFT, padx=5)
+
+
         normalization_frame = ttk.Frame(self.root)
         normalization_frame.pack(pady=5)
 
         ttk.Button(
             normalization_frame, 
             text="Plot Correlation Matrix", 
-            command=lambda: [dataset.set_correlation_matrix(), plot_correlation_matrix(dataset.get_correlation_matrix())]
+            command=self.on_plot_correlation_matrix
         ).pack(side=tk.LEFT, padx=5)
 
         ttk.Button(
@@ -211,12 +323,19 @@ class DataAnalysisGUI:
         ttk.Button(
             normalization_frame, 
             text="Change", 
-            command=lambda: self.change_dataset(dataset, type=self.selected_dataset.get())
+            command=lambda: self.change_dataset(self.dataset, type=self.selected_dataset.get())
         ).pack(side=tk.LEFT, padx=5)
 
         self.dataset_change_label = tk.Label(normalization_frame, text="", fg="green")
         self.dataset_change_label.pack()
 
+        # disabled while the full dataset loads in the background, until it replaces the sample
+        self.analysis_buttons = [
+            widget for frame in (options_frame, button_frame, power_curve_frame, normalization_frame)
+            for widget in frame.winfo_children()
+            if isinstance(widget, ttk.Button) and widget is not getattr(self, "full_load_button", None)
+        ]
+
         self.tabs = ttk.Notebook(self.root)
         self.tabs.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
@@ -234,6 +353,29 @@ class DataAnalysisGUI:
                 elif type == "variable":
                     analysis_key = f"variable_ranges_{'T' + turbine_id if turbine_id.isdigit() else 'all'}"
                     result_df = dataset.analyze_variable_ranges(turbine_id)             
+                elif type == "imputed":
+                    analysis_key = f"imputed_values_{'T' + turbine_id if turbine_id.isdigit() else 'all'}"
+                    result_df = dataset.analyze_flags("imputed", turbine_id)
+                elif type == "anomaly":
+                    analysis_key = f"anomalies_{'T' + turbine_id if turbine_id.isdigit() else 'all'}"
+                    result_df = dataset.analyze_anomalies(turbine_id)
+                elif type == "stuck":
+                    analysis_key = f"stuck_values_{'T' + turbine_id if turbine_id.isdigit() else 'all'}"
+                    result_df = dataset.analyze_flags("stuck", turbine_id)
+                elif type == "status":
+                    analysis_key = f"status_{'T' + turbine_id if turbine_id.isdigit() else 'all'}"
+                    result_df = dataset.analyze_status(turbine_id)
+                elif type == "memory":
+                    analysis_key = "memory_usage"
+                    result_df = dataset.analyze_memory_usage()
+                elif type == "profile":
+                    analysis_key = "pipeline_profile"
+                    result_df = profiler.summary()
+                elif type == "power_curve":
+                    analysis_key = f"power_curve_{'T' + turbine_id if turbine_id.isdigit() else 'all'}"
+                    result_df = dataset.analyze_power_curve()["curve"]
+                    if turbine_id.isdigit():
+                        result_df = result_df[result_df["turbine_id"] == int(turbine_id)]
             
                 if analysis_key in self.analysis_frames:
                     self.tabs.forget(self.analysis_frames[analysis_key])
@@ -256,7 +398,66 @@ class DataAnalysisGUI:
         except Exception as e:
             messagebox.showerror("Analysis error", str(e))
 
-    def display_dataframe(self, df: pd.DataFrame, parent):
+    def refresh_data(self):
+        try:
+            refreshed_files = self.app_state.refresh_dataset()
+            self.df = self.dataset.get_dataframe()
+            self.dataset_change_label.config(text="Loaded preprocessed dataset")
+
+            if refreshed_files:
+                messagebox.showinfo("Refresh Completed", f"Loaded {len(refreshed_files)} new or changed files.")
+            else:
+                messagebox.showinfo("Refresh Completed", "No new or changed files found.")
+
+        except Exception as e:
+            messagebox.showerror("Refresh error", str(e))
+
+    def start_full_load(self):
+        self.full_load_button.config(state=tk.DISABLED, text="Loading full data...")
+        self.set_analysis_buttons_state(tk.DISABLED)
+        self.full_load = {"error": None}
+
+        def load():
+            try:
+                self.app_state.load_full_dataset()
+            except Exception as e:
+                self.full_load["error"] = e
+
+        self.full_load["thread"] = threading.Thread(target=load, daemon=True)
+        self.full_load["thread"].start()
+        self.root.after(500, self.check_full_load)
+
+    def check_full_load(self):
+        # tkinter is not thread-safe - the worker only loads, the window is updated from here
+        if self.full_load["thread"].is_alive():
+            self.root.after(500, self.check_full_load)
+            return
+
+        if self.full_load["error"] is not None:
+            self.full_load_button.config(state=tk.NORMAL, text="Load Full Data")
+            self.set_analysis_buttons_state(tk.NORMAL)
+            messagebox.showerror("Full load error", str(self.full_load["error"]))
+            return
+
+        self.dataset = self.app_state.get_dataset()
+        self.dataset.set_statistics_mode("approximate" if self.approximate_statistics.get() else "exact")
+        self.df = self.dataset.get_dataframe()
+        self.full_load_button.pack_forget()
+        self.set_analysis_buttons_state(tk.NORMAL)
+        self.root.title("Wind Farm Data Analysis")
+        self.dataset_change_label.config(text="Loaded preprocessed dataset")
+        messagebox.showinfo("Full load completed", f"Loaded full dataset of {len(self.df)} records.")
+
+    def set_analysis_buttons_state(self, state: str):
+        for button in self.analysis_buttons:
+            button.config(state=state)
+
+    def export_profile(self):
+        path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON", "*.json")])
+        if path:
+            profiler.to_json(path)
+
+    def display_dataframe(self, df: "pd.DataFrame", parent):
         container = ttk.Frame(parent)
         container.pack(fill=tk.BOTH, expand=True)
 
@@ -298,14 +499,37 @@ class DataAnalysisGUI:
             return
         self.selected_parameter = values[0]
       
+    def on_plot_uptime(self):
+        from plots import plot_data_uptime
+
+        plot_data_uptime(self.df, turbine_id=self.selected_turbine.get())
+
+    def on_plot_power_curve(self):
+        from plots import plot_power_curve
+
+        plot_power_curve(self.dataset.analyze_power_curve()["curve"], turbine_id=self.selected_turbine.get())
+
+    def on_plot_correlation_matrix(self):
+        from plots import plot_correlation_matrix
+
+        self.dataset.set_correlation_matrix()
+        plot_correlation_matrix(self.dataset.get_correlation_matrix())
+
     def on_plot_boxplot(self):
+        from plots import plot_variable_boxplot
+
         if not self.selected_parameter:
             messagebox.showwarning("No parameter selected", "Select signal from Variable Analysis tab first.")
             return
         turbine = self.selected_turbine.get()
-        plot_variable_boxplot(self.df, self.selected_parameter, turbine)
+        stats = None
+        if self.approximate_statistics.get() and self.df is self.dataset.get_dataframe():
+            stats = self.dataset.get_boxplot_stats(self.selected_parameter, turbine)
+        plot_variable_boxplot(self.df, self.selected_parameter, turbine, stats=stats)
 
     def on_plot_histogram(self):
+        from plots import plot_variable_histogram
+
         if not self.selected_parameter:
             messagebox.showwarning("No parameter selected", "Select signal from Variable Analysis tab first.")
             return
@@ -313,13 +537,15 @@ class DataAnalysisGUI:
         plot_variable_histogram(self.df, self.selected_parameter, turbine)
 
     def on_plot_timeline(self):
+        from plots import plot_variable_timeline
+
         if not self.selected_parameter:
             messagebox.showwarning("No parameter selected", "Select signal from Variable Ranges tab first.")
             return
         turbine = self.selected_turbine.get()
         plot_variable_timeline(self.df, self.selected_parameter, turbine)
 
-    def change_dataset(self, dataset: WindFarmDataset, type: str):
+    def change_dataset(self, dataset: "WindFarmDataset", type: str):
         if type == "preprocessed":
             self.df = dataset.get_dataframe()
 
@@ -333,6 +559,8 @@ class DataAnalysisGUI:
 
 
     def run_correlation_analysis(self, preview: bool = True):
+        import pandas as pd
+
         try:
             correlation_analysis = self.dataset.remove_correlated_signals(threshold=0.95, preview=preview)
 
@@ -0,0 +1,199 @@
+import functools
+import json
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+class StageRecord:
+    def __init__(self, stage: str, context: dict):
+        self.stage = stage
+        self.context = dict(context)
+        self.rows = None
+        self.columns = None
+        self.seconds = 0.0
+        self.peak_mb = None
+        self.start_memory = 0
+        self.peak_memory = 0
+
+
+    def set_shape(self, obj):
+        shape = getattr(obj, "shape", None)
+        if shape is not None and len(shape) == 2:
+            self.rows, self.columns = int(shape[0]), int(shape[1])
+        elif shape is not None and len(shape) == 1:
+            self.rows, self.columns = int(shape[0]), 1
+
+
+    def to_dict(self) -> dict:
+        return {
+            "stage": self.stage,
+            **self.context,
+            "seconds": round(self.seconds, 6),
+            "rows": self.rows,
+            "columns": self.columns,
+            "peak_mb": self.peak_mb,
+        }
+
+
+class _DisabledStage:
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exc):
+        return False
+
+
+    def set_shape(self, obj):
+        pass
+
+
+_DISABLED_STAGE = _DisabledStage()
+
+
+class PipelineProfiler:
+    def __init__(self):
+        self.enabled = False
+        self.trace_memory = True
+        self.owns_tracing = False
+        self.records = []
+        self.context = {}
+        self.active = []
+        self.thread = None
+
+
+    def enable(self, trace_memory: bool = True):
+        self.enabled = True
+        self.thread = threading.get_ident()
+        self.trace_memory = trace_memory
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.owns_tracing = True
+
+
+    def disable(self):
+        self.enabled = False
+        if self.owns_tracing:
+            tracemalloc.stop()
+            self.owns_tracing = False
+
+
+    def reset(self):
+        self.records = []
+        self.context = {}
+        self.active = []
+
+
+    def recording(self) -> bool:
+        # stages are recorded only from the thread that enabled the profiler - a background load
+        # must not interleave its stages with the ones of analyses run meanwhile
+        return self.enabled and threading.get_ident() == self.thread
+
+
+    @contextmanager
+    def scope(self, **context):
+        if not self.recording():
+            yield
+            return
+
+        previous = self.context
+        self.context = {**previous, **context}
+        try:
+            yield
+        finally:
+            self.context = previous
+
+
+    def stage(self, name: str):
+        if not self.recording():
+            return _DISABLED_STAGE
+
+        return self._run_stage(name)
+
+
+    @contextmanager
+    def _run_stage(self, name: str):
+        record = StageRecord(name, self.context)
+
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            # peak reached so far belongs to the enclosing stage, before it is reset for this one
+            if self.active:
+                self.active[-1].peak_memory = max(self.active[-1].peak_memory, peak)
+            tracemalloc.reset_peak()
+            record.start_memory = current
+            record.peak_memory = current
+
+        self.active.append(record)
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.seconds = time.perf_counter() - start
+            self.active.pop()
+
+            if self.trace_memory:
+                _, peak = tracemalloc.get_traced_memory()
+                record.peak_memory = max(record.peak_memory, peak)
+                record.peak_mb = round((record.peak_memory - record.start_memory) / 2**20, 3)
+                if self.active:
+                    self.active[-1].peak_memory = max(self.active[-1].peak_memory, record.peak_memory)
+                tracemalloc.reset_peak()
+
+            self.records.append(record)
+
+
+    def to_records(self) -> list[dict]:
+        return [record.to_dict() for record in self.records]
+
+
+    def to_json(self, path: str):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_records(), file, indent=2, default=str)
+
+
+    def summary(self):
+        import pandas as pd
+
+        records = pd.DataFrame(self.to_records())
+        if records.empty:
+            return pd.DataFrame(columns=["stage", "calls", "total_s", "mean_s", "max_s", "rows", "max_peak_mb"])
+
+        summary = records.groupby("stage", sort=False).agg(
+            calls=("seconds", "size"),
+            total_s=("seconds", "sum"),
+            mean_s=("seconds", "mean"),
+            max_s=("seconds", "max"),
+            rows=("rows", "max"),
+            max_peak_mb=("peak_mb", "max"),
+        ).reset_index()
+
+        return summary.sort_values("total_s", ascending=False).round(4)
+
+
+profiler = PipelineProfiler()
+
+
+def profile_stage(name: str | None = None):
+    def decorator(func):
+        stage_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not profiler.recording():
+                return func(*args, **kwargs)
+
+            with profiler.stage(stage_name) as record:
+                result = func(*args, **kwargs)
+
+                # methods returning None (e.g. WindFarmDataset.normalize_data) report the data they worked on
+                shaped = result if hasattr(result, "shape") else getattr(args[0] if args else None, "data_frame", None)
+                record.set_shape(shaped)
+
+            return result
+
+        return wrapper
+
+    return decorator
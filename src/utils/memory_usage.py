@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+
+
+def column_buffer(series: pd.Series) -> np.ndarray | None:
+    values = series.array
+
+    if isinstance(values, pd.Categorical):
+        return values.codes
+
+    # numpy-backed columns expose their buffer without a copy, extension arrays may not
+    if isinstance(series.dtype, np.dtype):
+        return series.to_numpy(copy=False)
+
+    return None
+
+
+def frame_memory_ownership(view: pd.DataFrame, base: pd.DataFrame | None = None) -> pd.DataFrame:
+    rows = []
+
+    for col in view.columns:
+        shared = False
+        if base is not None and col in base.columns:
+            view_buffer = column_buffer(view[col])
+            base_buffer = column_buffer(base[col])
+            shared = view_buffer is not None and base_buffer is not None and np.shares_memory(view_buffer, base_buffer)
+
+        rows.append({
+            "column": col,
+            "bytes": int(view[col].memory_usage(index=False, deep=False)),
+            "shared": bool(shared),
+        })
+
+    return pd.DataFrame(rows, columns=["column", "bytes", "shared"])
@@ -1,23 +1,49 @@
 import numpy as np
 import pandas as pd
-from scipy.cluster.hierarchy import linkage, fcluster
-from scipy.spatial.distance import squareform
 
-from utils.file_handler import load_signal_ranges
+from analysis.anomaly_detection import AnomalyEngine
+from analysis.parallel import SharedTurbineExecutor, availability_reduction
+from analysis.power_curve import bin_power_curve
+from analysis.quantile_sketch import KLLSketch, SketchStore
+from analysis.window_features import WINDOW_STATS, feature_names, turbine_window_features, window_periods
+from utils.file_handler import ID_COLUMNS, load_signal_ranges
+from utils.flag_store import FlagStore
+from utils.instrumentation import profile_stage
+from utils.memory_usage import frame_memory_ownership
 
 
 class WindFarmDataset:
-    def __init__(self, data_frame: pd.DataFrame, dataset_type: str):
+    def __init__(self, data_frame: pd.DataFrame, dataset_type: str, flags: FlagStore | None = None, sampled: bool = False):
         self.name = dataset_type
         self.data_frame = data_frame
+        # built from a quick-look sample of rows, not every row of the files
+        self.sampled = sampled
+        self.flags = flags if flags is not None else self.create_flag_store(data_frame)
         self.normalized_data_frame = None
+        self.normalization_type = None
         self.correlation_matrix = None
-        self.id_cols = ["turbine_id", "record_id", "status_type_id"]
+        self.anomaly_engine = None
+        self.power_curve_cache = {}
+        self.window_features_cache = {}
+        self.turbine_executor = None
+        self.statistics_mode = "exact"
+        self.sketch_k = 200
+        self.sketches = None
+        self.id_cols = ID_COLUMNS
         self.core_features = ["timestamp", "turbine_id", "is_invalid"]
+        self.annotation_cols = ["status", "status_category"]
 
 
     def get_dataframe(self) -> pd.DataFrame:    
         return self.data_frame
+
+
+    def create_flag_store(self, data_frame: pd.DataFrame) -> FlagStore:
+        flags = FlagStore(len(data_frame))
+        if "is_invalid" in data_frame.columns:
+            flags.set("invalid", "is_invalid", data_frame["is_invalid"].to_numpy())
+
+        return flags
     
 
     def get_dataframe_normalized(self) -> pd.DataFrame:    
@@ -38,30 +64,62 @@ class WindFarmDataset:
         return self.correlation_matrix
 
 
+    def get_turbine_executor(self) -> SharedTurbineExecutor:
+        if self.turbine_executor is None:
+            columns = self.data_frame.select_dtypes(include=[np.number, "bool"]).columns
+            self.turbine_executor = SharedTurbineExecutor(self.data_frame, columns)
+
+        return self.turbine_executor
+
+
+    def invalidate_turbine_executor(self):
+        # the executor's shared memory and worker processes hold the data as it was
+        if self.turbine_executor is not None:
+            self.turbine_executor.close()
+        self.turbine_executor = None
+
+
+    def map_turbines(self, func, *args) -> list[tuple]:
+        return self.get_turbine_executor().map(func, *args)
+
+
+    @profile_stage()
     def analyze_availability(self) -> pd.DataFrame:
         df = self.data_frame
         analysis_results = []
 
-        group_col = "turbine_id"
-        groups = df.groupby(group_col)
+        columns = [col for col in df.columns if col not in self.annotation_cols]
+        executor = self.get_turbine_executor()
 
-        for turbine_id, turbine_data in groups:
-            total_parameters = len(turbine_data.columns)
-            missing_values = turbine_data.isna().sum().sum()
+        # numeric and bool columns are reduced in the executor, the remaining ones here
+        other_cols = [col for col in columns if col not in executor.columns]
+        other_missing = df[other_cols].isna().sum(axis=1).groupby(df["turbine_id"]).sum() if other_cols else None
 
-            total_values = turbine_data.size
-            missing_percent = 100 * missing_values / total_values
+        invalid_col = executor.columns.index("is_invalid")
+
+        for turbine_id, turbine_stats in executor.map(availability_reduction, invalid_col):
+            total_parameters = len(columns)
+            missing_values = turbine_stats["missing_values"]
+            if other_missing is not None:
+                missing_values += other_missing[turbine_id]
 
-            total_datapoints = len(turbine_data)
+            total_datapoints = turbine_stats["datapoints"]
 
-            invalid_datapoints = (turbine_data["is_invalid"]).sum()
+            total_values = total_datapoints * total_parameters
+            missing_percent = 100 * missing_values / total_values
+
+            invalid_datapoints = turbine_stats["invalid_datapoints"]
             invalid_percent = 100 * invalid_datapoints / total_datapoints
 
-            first_timestamp = turbine_data.index[0]
-            last_timestamp = turbine_data.index[-1]
+            first_timestamp = executor.to_timestamp(turbine_stats["first_timestamp"])
+            last_timestamp = executor.to_timestamp(turbine_stats["last_timestamp"])
 
-            expected_datapoints = int((first_timestamp - last_timestamp) / np.timedelta64(10, 'm')) * (-1) + 1
-            uptime_percent = 100 * total_datapoints / expected_datapoints
+            # a sample has gaps by design, its uptime says nothing about the turbine
+            if self.sampled or pd.isna(first_timestamp):
+                uptime_percent = np.nan
+            else:
+                expected_datapoints = int((first_timestamp - last_timestamp) / np.timedelta64(10, 'm')) * (-1) + 1
+                uptime_percent = 100 * total_datapoints / expected_datapoints
 
             analysis_results.append({
                 "turbine_id": turbine_id,
@@ -78,6 +136,7 @@ class WindFarmDataset:
         return pd.DataFrame(analysis_results)
 
 
+    @profile_stage()
     def analyze_variable_ranges(self, turbine_id: str | None = None) -> pd.DataFrame:
         df = self.data_frame
 
@@ -85,14 +144,132 @@ class WindFarmDataset:
             df = df[df["turbine_id"] == int(turbine_id)]
 
         num_cols = self.get_numeric_cols_list()
+
+        if self.statistics_mode == "approximate":
+            selected_turbine = int(turbine_id) if turbine_id and turbine_id.lower() != "all" else None
+            return self.get_approximate_ranges(num_cols, selected_turbine)
+
         df_numbers = df[num_cols]
         variable_ranges = df_numbers.describe().transpose()
-        variable_ranges = variable_ranges[["min", "max", "mean", "std"]]
+        variable_ranges = variable_ranges[["min", "max", "mean", "std", "25%", "50%", "75%"]]
         variable_ranges.reset_index(inplace=True)
         variable_ranges.rename(columns={"index": "parameter"}, inplace=True)
         return variable_ranges
 
 
+    def set_statistics_mode(self, mode: str, epsilon: float | None = None):
+        if mode not in ("exact", "approximate"):
+            raise ValueError(f"Unknown statistics mode: {mode}")
+
+        if epsilon is not None and KLLSketch.k_for_error(epsilon) != self.sketch_k:
+            self.sketch_k = KLLSketch.k_for_error(epsilon)
+            self.sketches = None
+
+        self.statistics_mode = mode
+
+
+    def get_sketches(self) -> SketchStore:
+        if self.sketches is None:
+            self.sketches = SketchStore(self.sketch_k)
+            self.sketches.update(self.data_frame, self.get_numeric_cols_list())
+
+        return self.sketches
+
+
+    def get_approximate_ranges(self, num_cols: list[str], turbine_id=None) -> pd.DataFrame:
+        sketches = self.get_sketches()
+        variable_ranges = []
+
+        for col in num_cols:
+            sketch = sketches.get(col, turbine_id)
+            q1, median, q3 = sketch.quantile([0.25, 0.5, 0.75])
+
+            variable_ranges.append({
+                "parameter": col,
+                "min": sketch.min,
+                "max": sketch.max,
+                "mean": sketch.mean if sketch.count else np.nan,
+                "std": sketch.std,
+                "25%": q1,
+                "50%": median,
+                "75%": q3,
+            })
+
+        return pd.DataFrame(variable_ranges)
+
+
+    def get_boxplot_stats(self, parameter: str, turbine_id: str = "all") -> list[dict]:
+        sketches = self.get_sketches()
+        turbines = sketches.get_turbines(parameter)
+        if turbine_id.lower() != "all":
+            turbines = [int(turbine_id)]
+
+        boxplot_stats = []
+        for turbine in turbines:
+            sketch = sketches.get(parameter, turbine)
+            q1, median, q3 = sketch.quantile([0.25, 0.5, 0.75])
+            iqr = q3 - q1
+
+            # whiskers at 1.5 IQR clipped to the data range - individual fliers are not kept by the sketch
+            boxplot_stats.append({
+                "label": str(turbine),
+                "med": median,
+                "q1": q1,
+                "q3": q3,
+                "whislo": max(sketch.min, q1 - 1.5 * iqr),
+                "whishi": min(sketch.max, q3 + 1.5 * iqr),
+                "fliers": [],
+            })
+
+        return boxplot_stats
+
+
+    @profile_stage()
+    def analyze_status(self, turbine_id: str | None = None) -> pd.DataFrame:
+        df = self.data_frame
+        if "status" not in df.columns:
+            raise ValueError("No status or event information loaded for this dataset.")
+
+        if turbine_id and turbine_id.lower() != "all":
+            df = df[df["turbine_id"] == int(turbine_id)]
+
+        num_cols = self.get_numeric_cols_list()
+        status = df["status"].cat.add_categories("no status").fillna("no status")
+        category = df["status_category"].cat.add_categories("-").fillna("-")
+
+        summary = pd.DataFrame({
+            "status": status,
+            "category": category,
+            "datapoints": 1,
+            "invalid_datapoints": df["is_invalid"].to_numpy(dtype=int),
+            "missing_values": df[num_cols].isna().sum(axis=1).to_numpy(),
+        }).groupby(["status", "category"], observed=True).sum().reset_index()
+
+        summary["invalid_datapoints_%"] = (100 * summary["invalid_datapoints"] / summary["datapoints"]).round(2)
+        summary["missing_values_%"] = (100 * summary["missing_values"] / (summary["datapoints"] * max(len(num_cols), 1))).round(2)
+
+        return summary.drop(columns=["invalid_datapoints", "missing_values"]).sort_values("datapoints", ascending=False)
+
+
+    @profile_stage()
+    def analyze_flags(self, flag: str = "imputed", turbine_id: str | None = None) -> pd.DataFrame:
+        if flag == "outlier" and not self.flags.get_signals("outlier"):
+            self.create_outliers_mask()
+
+        turbine_ids = self.data_frame["turbine_id"].to_numpy()
+        flags_percent = self.flags.percent_by_group(flag, turbine_ids)
+        flags_percent.columns = [f"T{col}_%" for col in flags_percent.columns]
+
+        if turbine_id and turbine_id.lower() != "all":
+            flags_percent = flags_percent[[f"T{turbine_id}_%"]]
+
+        flags_percent.insert(0, "all_%", self.flags.percent_by_group(flag, np.zeros(len(turbine_ids))).iloc[:, 0])
+        flags_percent = flags_percent.reset_index().rename(columns={"signal": "parameter"})
+
+        return flags_percent
+
+
+    @profile_stage()
     def analyze_overview(self, turbine_id: str | None = None) -> dict:
         overview = {
             "availability_and_time_ranges": self.analyze_availability(),
@@ -101,80 +278,314 @@ class WindFarmDataset:
         return overview
     
 
+    @profile_stage()
+    def detect_anomalies(self, signals: list[str] | None = None, min_signals: int = 1):
+        self.invalidate_turbine_executor()
+        self.anomaly_engine = AnomalyEngine(signals=signals, min_signals=min_signals)
+        self.data_frame["anomaly"] = self.anomaly_engine.process_chunk(self.data_frame).to_numpy()
+
+        return int(self.data_frame["anomaly"].sum())
+
+
+    @profile_stage()
+    def analyze_anomalies(self, turbine_id: str | None = None) -> pd.DataFrame:
+        if self.anomaly_engine is None:
+            # rolling windows need consecutive rows, a quick-look sample has none
+            if self.sampled:
+                raise ValueError("Anomaly detection needs the full dataset, load it first.")
+            self.detect_anomalies()
+
+        df = self.data_frame
+        if turbine_id and turbine_id.lower() != "all":
+            df = df[df["turbine_id"] == int(turbine_id)]
+
+        anomalies = df.groupby("turbine_id")["anomaly"].agg(["size", "sum"])
+        anomalies.columns = ["datapoints", "anomalies"]
+        anomalies["anomalies_%"] = (100 * anomalies["anomalies"] / anomalies["datapoints"]).round(2)
+
+        return anomalies.reset_index()
+
+
+    @profile_stage()
+    def analyze_power_curve(self, bin_width: float = 0.5, quantiles: tuple[float, ...] = (0.1, 0.5, 0.9)) -> dict:
+        key = (bin_width, tuple(quantiles))
+        if key in self.power_curve_cache:
+            return self.power_curve_cache[key]
+
+        for col in ("power", "wind_speed"):
+            if col not in self.data_frame.columns:
+                raise ValueError(f"Column '{col}' not found in dataset.")
+
+        curve, residuals = self.compute_power_curve(self.data_frame, bin_width, quantiles)
+
+        result = {
+            "curve": curve,
+            "residuals": pd.DataFrame(residuals, index=self.data_frame.index, columns=["power_residual", "power_residual_z"]),
+        }
+        self.power_curve_cache[key] = result
+        return result
+
+
+    def compute_power_curve(self, df: pd.DataFrame, bin_width: float, quantiles: tuple[float, ...]) -> tuple[pd.DataFrame, np.ndarray]:
+        fit_mask = ~df["is_invalid"].to_numpy(dtype=bool) if "is_invalid" in df.columns else None
+
+        return bin_power_curve(
+            df["turbine_id"].to_numpy(),
+            df["wind_speed"].to_numpy(dtype=float),
+            df["power"].to_numpy(dtype=float),
+            bin_width=bin_width,
+            quantiles=quantiles,
+            fit_mask=fit_mask
+        )
+
+
+    @profile_stage()
+    def extract_window_features(self, signals: list[str] | None = None, windows: tuple[str, ...] = ("1h", "6h", "1D"),
+                                stats: tuple[str, ...] = WINDOW_STATS, min_periods: int = 1, period: str = "10min") -> pd.DataFrame:
+        signals = tuple(signals or self.get_numeric_cols_list())
+        key = (signals, tuple(windows), tuple(stats), min_periods, period)
+        if key in self.window_features_cache:
+            return self.window_features_cache[key]
+
+        for stat in stats:
+            if stat not in WINDOW_STATS:
+                raise ValueError(f"Unknown window statistic: {stat}")
+
+        lengths = window_periods(windows, period)
+        executor = self.get_turbine_executor()
+
+        missing = [signal for signal in signals if signal not in executor.columns]
+        if missing:
+            raise ValueError(f"Columns not found in dataset: {missing}")
+
+        column_indices = [executor.columns.index(signal) for signal in signals]
+        results = executor.map(turbine_window_features, column_indices, lengths, tuple(stats),
+                               pd.Timedelta(period).value, min_periods)
+
+        # feature-major, so the frame below takes the array as its block without a copy;
+        # per-turbine results follow the executor's sorted row order
+        features = np.empty((len(lengths) * len(stats) * len(signals), len(self.data_frame)))
+        for (_, start, stop), (_, turbine_features) in zip(executor.segments, results):
+            features[:, executor.segment_rows(start, stop)] = turbine_features
+
+        result = pd.DataFrame(features.T, index=self.data_frame.index, columns=feature_names(list(signals), list(windows), tuple(stats)), copy=False)
+        self.window_features_cache[key] = result
+        return result
+
+
+    @profile_stage()
+    def append_data(self, new_data: pd.DataFrame, new_flags: FlagStore | None = None) -> list:
+        df = self.data_frame
+        new_data = new_data.reindex(columns=df.columns)
+
+        turbine_ids = df["turbine_id"].to_numpy()
+        times = df.index.as_unit("ns").asi8
+        new_turbine_ids = new_data["turbine_id"].to_numpy()
+        new_times = new_data.index.as_unit("ns").asi8
+
+        new_ranges = pd.Series(new_times).groupby(new_turbine_ids).agg(["min", "max"])
+        previous_last = pd.Series(times).groupby(turbine_ids).max()
+        affected = new_ranges.index.tolist()
+
+        # rows of a turbine inside the time range of its new data are replaced
+        # looked up by position, a map with fillna would send the int64 bounds through float64;
+        # turbines without new data get position -1, the empty range appended at the end
+        no_range = np.iinfo(np.int64).max
+        range_idx = new_ranges.index.get_indexer(turbine_ids)
+        range_start = np.append(new_ranges["min"].to_numpy(dtype=np.int64), no_range)[range_idx]
+        range_end = np.append(new_ranges["max"].to_numpy(dtype=np.int64), -no_range)[range_idx]
+        kept = np.flatnonzero((times < range_start) | (times > range_end))
+
+        combined = pd.concat([df.iloc[kept], new_data])
+        for col in self.annotation_cols:
+            if col in combined.columns:
+                combined[col] = combined[col].astype("category")
+
+        order = np.lexsort((np.concatenate([times[kept], new_times]), np.concatenate([turbine_ids[kept], new_turbine_ids])))
+
+        # position of every row of the new frame in the old frame, -1 for appended rows
+        source_positions = np.concatenate([kept, np.full(len(new_data), -1)])[order]
+
+        self.data_frame = combined.iloc[order]
+
+        if new_flags is None:
+            new_flags = self.create_flag_store(new_data)
+        self.flags = FlagStore.concat([self.flags.take(kept), new_flags]).take(order)
+
+        appended_only = [
+            turbine_id for turbine_id in affected
+            if turbine_id in previous_last.index and new_ranges.loc[turbine_id, "min"] > previous_last[turbine_id]
+        ]
+        self.update_cached_results(affected, appended_only, source_positions)
+
+        return affected
+
+
+    def update_cached_results(self, affected: list, appended_only: list, source_positions: np.ndarray):
+        df = self.data_frame
+        turbine_ids = df["turbine_id"].to_numpy()
+        affected_rows = np.isin(turbine_ids, affected)
+
+        # statistics over the whole farm have to be recomputed on demand
+        self.invalidate_turbine_executor()
+        self.normalized_data_frame = None
+        self.correlation_matrix = None
+        self.window_features_cache = {}
+
+        # turbines with data only after their last timestamp continue from their streaming state,
+        # turbines with replaced history are processed again from their first row
+        replaced = [turbine_id for turbine_id in affected if turbine_id not in appended_only]
+        rows_to_process = np.flatnonzero(affected_rows & ((source_positions < 0) | np.isin(turbine_ids, replaced)))
+
+        if self.sketches is not None:
+            self.sketches.drop_turbines(replaced)
+            self.sketches.update(df.iloc[rows_to_process], self.get_numeric_cols_list())
+
+        if self.anomaly_engine is not None:
+            for turbine_id in replaced:
+                self.anomaly_engine.tails.pop(turbine_id, None)
+
+            anomaly = self.anomaly_engine.process_chunk(df.iloc[rows_to_process])
+            df.iloc[rows_to_process, df.columns.get_loc("anomaly")] = anomaly.to_numpy()
+
+        has_source = source_positions >= 0
+        for (bin_width, quantiles), cached in self.power_curve_cache.items():
+            residuals = np.full((len(df), 2), np.nan)
+            residuals[has_source] = cached["residuals"].to_numpy()[source_positions[has_source]]
+
+            curve, affected_residuals = self.compute_power_curve(df[affected_rows], bin_width, quantiles)
+            residuals[affected_rows] = affected_residuals
+
+            previous_curve = cached["curve"]
+            curve = pd.concat([previous_curve[~previous_curve["turbine_id"].isin(affected)], curve])
+            cached["curve"] = curve.sort_values(["turbine_id", "wind_speed_bin"]).reset_index(drop=True)
+            cached["residuals"] = pd.DataFrame(residuals, index=df.index, columns=cached["residuals"].columns)
+
+
+    @profile_stage()
     def create_outliers_mask(self):
         df = self.data_frame
         signals_ranges = load_signal_ranges()
-        self.outliers_mask = pd.DataFrame(False, index=df.index, columns=df.columns)
 
         for col, (min_val, max_val) in signals_ranges.items():
             if col in df.columns:
                 valid_mask = df[col].notna() & (df[col] >= min_val) & (df[col] <= max_val)
-                self.outliers_mask[col] = ~valid_mask
+                self.flags.set("outlier", col, ~valid_mask.to_numpy())
     
 
+    @profile_stage()
     def normalize_data(self, normalization_type: str):
+        if normalization_type not in ("robust", "z_score", "min_max"):
+            raise ValueError(f"Unknown normalization type: {normalization_type}")
+
         self.create_outliers_mask()
 
-        df_scaled = self.data_frame.copy()
+        # shallow copy - every column is shared with data_frame until it is replaced below
+        df_scaled = self.data_frame.copy(deep=False)
         num_cols = self.get_numeric_cols_list()
+        outlier_signals = self.flags.get_signals("outlier")
 
         for col in num_cols:
-            outlier_mask = self.outliers_mask[col]
-            df_scaled.loc[outlier_mask, col] = np.nan
+            col_vals = self.data_frame[col]
+            if col in outlier_signals:
+                col_vals = col_vals.mask(self.flags.get("outlier", col))
 
-        if (normalization_type == "robust"):
-            for col in num_cols:
-                col_vals = df_scaled[col]
-                mask_valid = (~col_vals.isna())
+            valid_vals = col_vals[col_vals.notna()]
 
-                median = col_vals[mask_valid].median()
-                q1 = col_vals[mask_valid].quantile(0.25)
-                q3 = col_vals[mask_valid].quantile(0.75)
+            if (normalization_type == "robust" and self.statistics_mode == "approximate"):
+                # sketches are built on the preprocessed values, outliers included
+                sketch = self.get_sketches().get(col)
+                q1, median, q3 = sketch.quantile([0.25, 0.5, 0.75])
                 iqr = q3 - q1
                 if iqr == 0:
-                    iqr = col_vals[mask_valid].std()
+                    iqr = sketch.std
 
-                df_scaled.loc[mask_valid, col] = (col_vals[mask_valid] - median) / iqr
+                df_scaled[col] = (col_vals - median) / iqr
+
+            elif (normalization_type == "robust"):
+                median = valid_vals.median()
+                q1 = valid_vals.quantile(0.25)
+                q3 = valid_vals.quantile(0.75)
+                iqr = q3 - q1
+                if iqr == 0:
+                    iqr = valid_vals.std()
 
-        elif (normalization_type == "z_score"):
-            for col in num_cols:
-                col_vals = df_scaled[col]
-                mask_valid = (~col_vals.isna())
+                df_scaled[col] = (col_vals - median) / iqr
 
-                mean = col_vals[mask_valid].mean()
-                std = col_vals[mask_valid].std()
+            elif (normalization_type == "z_score"):
+                mean = valid_vals.mean()
+                std = valid_vals.std()
                 if std == 0:
+                    if col in outlier_signals:
+                        df_scaled[col] = col_vals
                     continue
 
-                df_scaled.loc[mask_valid, col] = (col_vals[mask_valid] - mean) / std
+                df_scaled[col] = (col_vals - mean) / std
 
-        elif (normalization_type == "min_max"):
-            for col in num_cols:
-                col_vals = df_scaled[col]
-                mask_valid = (~col_vals.isna())
+            elif (normalization_type == "min_max"):
+                min_val = valid_vals.min()
+                max_val = valid_vals.max()
 
-                min_val = col_vals[mask_valid].min()
-                max_val = col_vals[mask_valid].max()
+                df_scaled[col] = (col_vals - min_val) / (max_val - min_val)
 
-                df_scaled.loc[mask_valid, col] = (
-                    (col_vals[mask_valid] - min_val) / (max_val - min_val)
-                )
+        self.normalized_data_frame = df_scaled
+        self.normalization_type = normalization_type
+
+
+    @profile_stage()
+    def analyze_memory_usage(self) -> pd.DataFrame:
+        views = {"preprocessed": self.data_frame}
+        if self.normalized_data_frame is not None:
+            views[f"normalized ({self.normalization_type})"] = self.normalized_data_frame
+
+        results = []
+        for name, view in views.items():
+            ownership = frame_memory_ownership(view, self.data_frame if view is not self.data_frame else None)
+            owned = ownership[~ownership["shared"]]
+
+            results.append({
+                "view": name,
+                "columns": len(ownership),
+                "owned_columns": len(owned),
+                "total_mb": round(ownership["bytes"].sum() / 2**20, 2),
+                "owned_mb": round(owned["bytes"].sum() / 2**20, 2),
+            })
 
-        else:
-            raise ValueError(f"Unknown normalization type: {normalization_type}")
+        if self.turbine_executor is not None and self.turbine_executor.shared_memory_bytes():
+            executor_mb = round(self.turbine_executor.shared_memory_bytes() / 2**20, 2)
+            results.append({
+                "view": "turbine executor (shared memory)",
+                "columns": len(self.turbine_executor.columns),
+                "owned_columns": len(self.turbine_executor.columns),
+                "total_mb": executor_mb,
+                "owned_mb": executor_mb,
+            })
 
-        self.normalized_data_frame = df_scaled
+        flags_memory = self.flags.memory_usage()
+        results.append({
+            "view": "flags (packed bits)",
+            "columns": int(flags_memory["signals"].sum()),
+            "owned_columns": int(flags_memory["signals"].sum()),
+            "total_mb": round(flags_memory["packed_bytes"].sum() / 2**20, 2),
+            "owned_mb": round(flags_memory["packed_bytes"].sum() / 2**20, 2),
+        })
+
+        return pd.DataFrame(results)
 
     
+    @profile_stage()
     def set_correlation_matrix(self, method: str = "pearson"):
         if method == "pearson":
             num_cols = self.get_numeric_cols_list()
             self.correlation_matrix = self.data_frame[num_cols].corr(method=method, min_periods=500)
 
 
+    @profile_stage()
     def remove_correlated_signals(self, threshold: float = 0.95, preview: bool = True):
+        from scipy.cluster.hierarchy import linkage, fcluster
+
         numeric_cols = self.get_numeric_cols_list()
-        df = self.data_frame[numeric_cols].copy()
+        df = self.data_frame[numeric_cols]
         cols = df.columns
 
         if not isinstance(self.correlation_matrix, pd.DataFrame) or self.correlation_matrix.empty:
@@ -184,15 +595,15 @@ class WindFarmDataset:
 
         corr = corr.dropna(axis=0, how='all').dropna(axis=1, how='all')
         corr = corr.fillna(0)
-        np.fill_diagonal(corr.values, 1.0)
         cols = corr.columns
 
         # passing hierarchical clustering
-        dist_matrix = 1 - corr
-        np.fill_diagonal(dist_matrix.values, 0.0)
+        # (copied to numpy - with copy-on-write pandas .values of a frame is read-only)
+        dist_matrix = 1 - corr.to_numpy(copy=True)
+        np.fill_diagonal(dist_matrix, 0.0)
 
         # upper triangle
-        condensed = dist_matrix.values[np.triu_indices_from(dist_matrix.values, k=1)]
+        condensed = dist_matrix[np.triu_indices_from(dist_matrix, k=1)]
         condensed[condensed < 0] = 0
 
         linkage_matrix = linkage(condensed, method='average')
@@ -234,5 +645,9 @@ class WindFarmDataset:
         if not preview:
             to_remove = [c for c in to_remove if c not in self.core_features]
             self.data_frame.drop(columns=to_remove, inplace=True)
+            self.flags.drop_signals(to_remove)
+            self.power_curve_cache = {}
+            self.window_features_cache = {}
+            self.invalidate_turbine_executor()
 
         return result